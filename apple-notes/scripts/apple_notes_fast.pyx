@@ -0,0 +1,123 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled protobuf walker for export_notes.py.
+
+Mirrors extract_text_from_protobuf() on already-decompressed note data.
+Build in place with:  cythonize -i scripts/apple_notes_fast.pyx
+"""
+
+from libc.stdint cimport uint8_t, uint64_t
+
+cdef uint64_t _OVERFLOW = 0xFFFFFFFFFFFFFFF8ULL
+
+
+cdef inline uint64_t read_varint(const uint8_t* p, Py_ssize_t n, Py_ssize_t* pos) noexcept nogil:
+    """Read a protobuf varint at pos[0] and advance it (max 10 bytes)."""
+    cdef Py_ssize_t i = pos[0]
+    cdef uint64_t result = 0
+    cdef uint8_t b
+    cdef int shift = 0
+
+    # Fast path: most tags and lengths fit in a single byte
+    if i < n and p[i] < 0x80:
+        pos[0] = i + 1
+        return p[i]
+
+    while i < n and shift < 70:
+        b = p[i]
+        i += 1
+        if shift == 63 and (b & 0x7e):
+            # Value no longer fits in 64 bits; keep the wire type bits only
+            result |= _OVERFLOW
+        else:
+            result |= (<uint64_t>(b & 0x7f)) << shift
+        if b < 0x80:
+            break
+        shift += 7
+    pos[0] = i
+    return result
+
+
+cdef inline Py_ssize_t _field_end(Py_ssize_t pos, uint64_t length, Py_ssize_t n) noexcept nogil:
+    """End of a length-delimited field, clipped to the buffer."""
+    if length > <uint64_t>(n - pos):
+        return n
+    return pos + <Py_ssize_t>length
+
+
+cdef object _parse_text_block(const uint8_t* p, Py_ssize_t n):
+    """Field 2 of the text content block is the note text."""
+    cdef Py_ssize_t pos = 0, end
+    cdef uint64_t tag, length
+    while pos < n:
+        tag = read_varint(p, n, &pos)
+        if (tag & 0x7) == 0:
+            read_varint(p, n, &pos)
+        elif (tag & 0x7) == 2:
+            length = read_varint(p, n, &pos)
+            end = _field_end(pos, length, n)
+            if (tag >> 3) == 2:
+                try:
+                    decoded = (<const char*>p)[pos:end].decode('utf-8')
+                except UnicodeDecodeError:
+                    decoded = None
+                if decoded is not None and (len(decoded) > 10 and decoded.isprintable() or '\n' in decoded):
+                    return decoded
+            pos = end
+        else:
+            break
+    return None
+
+
+cdef object _parse_document(const uint8_t* p, Py_ssize_t n):
+    """Field 3 of the document is the text content block."""
+    cdef Py_ssize_t pos = 0, end
+    cdef uint64_t tag, length
+    while pos < n:
+        tag = read_varint(p, n, &pos)
+        if (tag & 0x7) == 0:
+            read_varint(p, n, &pos)
+        elif (tag & 0x7) == 2:
+            length = read_varint(p, n, &pos)
+            end = _field_end(pos, length, n)
+            if (tag >> 3) == 3 and end - pos > 50:
+                text = _parse_text_block(p + pos, end - pos)
+                if text is not None:
+                    return text
+            pos = end
+        else:
+            break
+    return None
+
+
+def extract_text(const unsigned char[::1] data):
+    """Return the note text from decompressed protobuf data, or None."""
+    cdef Py_ssize_t n = data.shape[0]
+    cdef Py_ssize_t pos = 0, end
+    cdef uint64_t tag, length, wire
+    cdef const uint8_t* p
+    if n == 0:
+        return None
+    p = &data[0]
+
+    while pos < n:
+        tag = read_varint(p, n, &pos)
+        wire = tag & 0x7
+        if wire == 0:  # Varint
+            read_varint(p, n, &pos)
+        elif wire == 2:  # Length-delimited
+            length = read_varint(p, n, &pos)
+            end = _field_end(pos, length, n)
+            # Field 2 at outer level is the document
+            if (tag >> 3) == 2 and end - pos > 100:
+                text = _parse_document(p + pos, end - pos)
+                if text is not None:
+                    return text
+            pos = end
+        elif wire == 5:  # 32-bit
+            pos += 4
+        elif wire == 1:  # 64-bit
+            pos += 8
+        else:
+            break
+    return None
@@ -6,127 +6,191 @@ Preserves text structure with proper line breaks and markdown formatting.
 """
 
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 import re
-import gzip
+
+try:
+    # ISA-L inflate is a drop-in, faster zlib when python-isal is installed
+    from isal import isal_zlib as _zlib
+except ImportError:
+    import zlib as _zlib
+
+try:
+    # Optional compiled walker (build with: cythonize -i scripts/apple_notes_fast.pyx)
+    from apple_notes_fast import extract_text as _fast_extract_text
+    HAS_FAST_EXTRACT = True
+except ImportError:
+    HAS_FAST_EXTRACT = False
+
+def _gunzip(data):
+    """Decompress a single-member gzip BLOB without the gzip module's framing."""
+    return _zlib.decompress(data, wbits=31)
+
+
+# sanitize_filename: characters invalid in filenames become '_', whitespace runs collapse
+_FILENAME_INVALID_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Note rows handed to the worker pool per round trip to SQLite
+_EXPORT_BATCH_SIZE = 256
+
+# Byte lookup table keeping printable ASCII plus tab/newline/CR, NUL otherwise
+_PRINTABLE = bytes(i if (0x20 <= i <= 0x7E or i in (9, 10, 13)) else 0 for i in range(256))
+
+# Fallback garbage filters in decode_note_content. The *_DELETE tables list
+# the bytes that do not count, so len(part.translate(None, table)) counts the rest.
+_TEXT_DELETE = bytes(i for i in range(256)
+                     if not (chr(i).isascii() and chr(i).isalnum() or chr(i) in ' .,!?:;\'-'))
+_ALNUM_DELETE = bytes(i for i in range(256)
+                      if not (chr(i).isascii() and chr(i).isalnum() or i == 0x20))
+# Characters of base64 / identifier-like tokens; deleting them empties a token
+_TOKEN_CHARS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=_-'
+
+# List patterns for format_as_markdown, tried only when the first character fits
+_BULLET_CHARS = '•-*○▪▸►◦‣⁃'
+_BULLET_RE = re.compile(r'^[\t ]*([•\-\*○▪▸►◦‣⁃])\s*(.+)$')
+_NUMBER_RE = re.compile(r'^[\t ]*(\d+)[.\)]\s*(.+)$')
+_LETTER_RE = re.compile(r'^[\t ]*([a-zA-Z])[.\)]\s*(.+)$')
+_CHECKBOX_RE = re.compile(r'^[\t ]*\[([xX ])\]\s*(.+)$')
+
+# Bit offsets for each byte of a varint (protobuf caps varints at 10 bytes)
+_SHIFTS = (0, 7, 14, 21, 28, 35, 42, 49, 56, 63)
 
 
 def read_varint(data, pos):
     """Read a protobuf varint from data at position pos."""
+    n = len(data)
+    # Fast path: most tags and lengths fit in a single byte
+    if pos < n:
+        b = data[pos]
+        if b < 0x80:
+            return b, pos + 1
+
     result = 0
-    shift = 0
-    while pos < len(data):
+    for shift in _SHIFTS:
+        if pos >= n:
+            break
         b = data[pos]
         result |= (b & 0x7f) << shift
         pos += 1
-        if not (b & 0x80):
+        if b < 0x80:
             break
-        shift += 7
     return result, pos
 
 
+def _parse_text_block(block):
+    """Return field 2 of a text content block if it holds the note text."""
+    pos = 0
+    n = len(block)
+    while pos < n:
+        tag, pos = read_varint(block, pos)
+        wire_type = tag & 0x7
+
+        if wire_type == 0:
+            _, pos = read_varint(block, pos)
+        elif wire_type == 2:
+            length, pos = read_varint(block, pos)
+            value = block[pos:pos+length]
+            pos += length
+
+            # Field 2 is the actual text string
+            if tag >> 3 == 2:
+                try:
+                    decoded = str(value, 'utf-8')
+                except UnicodeDecodeError:
+                    continue
+                # This is our text content!
+                if len(decoded) > 10 and decoded.isprintable() or '\n' in decoded:
+                    return decoded
+        else:
+            break
+    return None
+
+
+def _parse_document(document):
+    """Return the note text from the text content block (field 3) of a document."""
+    pos = 0
+    n = len(document)
+    while pos < n:
+        tag, pos = read_varint(document, pos)
+        wire_type = tag & 0x7
+
+        if wire_type == 0:
+            _, pos = read_varint(document, pos)
+        elif wire_type == 2:
+            length, pos = read_varint(document, pos)
+            value = document[pos:pos+length]
+            pos += length
+
+            # Field 3 is the text content block
+            if tag >> 3 == 3 and len(value) > 50:
+                text = _parse_text_block(value)
+                if text is not None:
+                    return text
+        else:
+            break
+    return None
+
+
 def extract_text_from_protobuf(data):
     """
     Extract the main text content from Apple Notes protobuf format.
     The text is stored as a single string in field 2 of the nested structure.
+    Each level returns as soon as the text is found.
     """
     if data is None:
         return None
 
-    try:
-        # Decompress if gzip
-        if len(data) >= 2 and data[:2] == b'\x1f\x8b':
-            data = gzip.decompress(data)
-
-        # Parse outer message
-        pos = 0
-        text_content = None
-
-        while pos < len(data):
-            if pos >= len(data):
-                break
-
-            # Read tag
-            tag, pos = read_varint(data, pos)
-            field_num = tag >> 3
-            wire_type = tag & 0x7
-
-            if wire_type == 0:  # Varint
-                _, pos = read_varint(data, pos)
-            elif wire_type == 2:  # Length-delimited
-                length, pos = read_varint(data, pos)
-                value = data[pos:pos+length]
-                pos += length
-
-                # Field 2 at outer level is the document
-                if field_num == 2 and len(value) > 100:
-                    # Parse inner document
-                    inner_pos = 0
-                    while inner_pos < len(value):
-                        inner_tag, inner_pos = read_varint(value, inner_pos)
-                        inner_field = inner_tag >> 3
-                        inner_wire = inner_tag & 0x7
-
-                        if inner_wire == 0:
-                            _, inner_pos = read_varint(value, inner_pos)
-                        elif inner_wire == 2:
-                            inner_len, inner_pos = read_varint(value, inner_pos)
-                            inner_value = value[inner_pos:inner_pos+inner_len]
-                            inner_pos += inner_len
-
-                            # Field 3 is the text content block
-                            if inner_field == 3 and len(inner_value) > 50:
-                                # Parse text content block
-                                text_pos = 0
-                                while text_pos < len(inner_value):
-                                    text_tag, text_pos = read_varint(inner_value, text_pos)
-                                    text_field = text_tag >> 3
-                                    text_wire = text_tag & 0x7
-
-                                    if text_wire == 0:
-                                        _, text_pos = read_varint(inner_value, text_pos)
-                                    elif text_wire == 2:
-                                        text_len, text_pos = read_varint(inner_value, text_pos)
-                                        text_value = inner_value[text_pos:text_pos+text_len]
-                                        text_pos += text_len
-
-                                        # Field 2 is the actual text string
-                                        if text_field == 2:
-                                            try:
-                                                decoded = text_value.decode('utf-8')
-                                                # This is our text content!
-                                                if len(decoded) > 10 and decoded.isprintable() or '\n' in decoded:
-                                                    text_content = decoded
-                                                    break
-                                            except:
-                                                pass
-                                    else:
-                                        break
-
-                                if text_content:
-                                    break
-                        else:
-                            break
-
-                    if text_content:
-                        break
-            elif wire_type == 5:  # 32-bit
-                pos += 4
-            elif wire_type == 1:  # 64-bit
-                pos += 8
-            else:
-                break
+    # Decompress if gzip
+    if len(data) >= 2 and data[:2] == b'\x1f\x8b':
+        try:
+            data = _gunzip(data)
+        except _zlib.error:
+            return None
+
+    if HAS_FAST_EXTRACT:
+        return _fast_extract_text(data)
+
+    # Parse outer message. read_varint stops at the end of the buffer and
+    # slices clip, so truncated data just ends the walk; nothing raises.
+    # Nested fields are memoryview slices, so no level copies its bytes.
+    data = memoryview(data)
+    pos = 0
+    n = len(data)
+    while pos < n:
+        # Read tag
+        tag, pos = read_varint(data, pos)
+        wire_type = tag & 0x7
+
+        if wire_type == 0:  # Varint
+            _, pos = read_varint(data, pos)
+        elif wire_type == 2:  # Length-delimited
+            length, pos = read_varint(data, pos)
+            value = data[pos:pos+length]
+            pos += length
+
+            # Field 2 at outer level is the document
+            if tag >> 3 == 2 and len(value) > 100:
+                text = _parse_document(value)
+                if text is not None:
+                    return text
+        elif wire_type == 5:  # 32-bit
+            pos += 4
+        elif wire_type == 1:  # 64-bit
+            pos += 8
+        else:
+            break
 
-        return text_content
-    except Exception as e:
-        return None
+    return None
 
 
 def decode_note_content(data):
     """
     Decode note content from the ZICNOTEDATA table.
-    First tries protobuf extraction, falls back to regex extraction.
+    First tries protobuf extraction, falls back to heuristic text extraction.
     """
     if data is None:
         return None
@@ -136,68 +200,65 @@ def decode_note_content(data):
     if text and len(text.strip()) > 10:
         return text.strip()
 
-    # Fallback: regex-based extraction
-    try:
-        if len(data) >= 2 and data[:2] == b'\x1f\x8b':
-            data = gzip.decompress(data)
+    # Fallback: heuristic extraction of readable text runs
+    if len(data) >= 2 and data[:2] == b'\x1f\x8b':
+        try:
+            data = _gunzip(data)
+        except _zlib.error as e:
+            return f"[Could not decode: {e}]"
+
+    decoded = data.decode('utf-8', errors='ignore')
+    # Runs of printable ASCII: zero out everything else and split on NUL.
+    # Re-encoding drops the invalid bytes the decode ignored, as before.
+    # Parts stay as bytes so every check below is a C-level bytes operation.
+    cleaned = decoded.encode('utf-8').translate(_PRINTABLE)
+    readable_parts = cleaned.split(b'\x00')
+
+    cleaned_parts = []
+    garbage_streak = 0
+    for part in readable_parts:
+        part = part.strip()
+        n = len(part)
+        if n <= 3:
+            continue
 
-        decoded = data.decode('utf-8', errors='ignore')
-        readable_parts = re.findall(r'[\x20-\x7E\n\r\t]+', decoded)
+        ratio = len(part.translate(None, _TEXT_DELETE)) / n
+        is_garbage = False
+
+        if n < 10:
+            alpha_ratio = len(part.translate(None, _ALNUM_DELETE)) / n
+            if alpha_ratio < 0.7:
+                is_garbage = True
+            elif b' ' not in part and n < 8 and not part.isalpha():
+                is_garbage = True
+
+        if ratio < 0.6:
+            is_garbage = True
+        elif n < 15 and ratio < 0.75:
+            is_garbage = True
+        elif n >= 10 and not part.translate(None, _TOKEN_CHARS):
+            # Looks like a base64 / identifier token
+            is_garbage = True
+        elif b'\t' in part and n < 30:
+            is_garbage = True
+        elif n < 20 and part.endswith((b'h', b'(')):
+            is_garbage = True
+        elif part[0] in b'!+,<>{}[]' and n < 15:
+            is_garbage = True
+
+        if is_garbage:
+            garbage_streak += 1
+            if garbage_streak >= 3:
+                break
+        else:
+            garbage_streak = 0
+            cleaned_parts.append(part.decode('ascii'))
 
-        cleaned_parts = []
-        garbage_streak = 0
-        for part in readable_parts:
-            part = part.strip()
-            if len(part) <= 3:
-                continue
+    if cleaned_parts:
+        # Drop repeated parts, keeping first-seen order
+        return '\n'.join(dict.fromkeys(cleaned_parts))
 
-            text_chars = sum(1 for c in part if c.isalnum() or c in ' .,!?:;\'-')
-            is_garbage = False
-
-            if len(part) > 0:
-                ratio = text_chars / len(part)
-
-                if len(part) < 10:
-                    alpha_ratio = sum(1 for c in part if c.isalnum() or c == ' ') / len(part)
-                    if alpha_ratio < 0.7:
-                        is_garbage = True
-                    elif ' ' not in part and len(part) < 8 and not part.isalpha():
-                        is_garbage = True
-
-                if ratio < 0.6:
-                    is_garbage = True
-                elif len(part) < 15 and ratio < 0.75:
-                    is_garbage = True
-                elif re.match(r'^[A-Za-z0-9+/=_\-]{10,}$', part) and ' ' not in part:
-                    is_garbage = True
-                elif '\t' in part and len(part) < 30:
-                    is_garbage = True
-                elif len(part) < 20 and part.endswith(('h', '(')):
-                    is_garbage = True
-                elif part[0] in '!+,<>{}[]' and len(part) < 15:
-                    is_garbage = True
-
-            if is_garbage:
-                garbage_streak += 1
-                if garbage_streak >= 3:
-                    break
-            else:
-                garbage_streak = 0
-                if not re.match(r'^[A-Za-z]{1,2}$', part):
-                    cleaned_parts.append(part)
-
-        if cleaned_parts:
-            seen = set()
-            unique_parts = []
-            for part in cleaned_parts:
-                if part not in seen:
-                    seen.add(part)
-                    unique_parts.append(part)
-            return '\n'.join(unique_parts)
-
-        return decoded.strip()
-    except Exception as e:
-        return f"[Could not decode: {e}]"
+    return decoded.strip()
 
 
 def format_as_markdown(text):
@@ -229,8 +290,11 @@ def format_as_markdown(text):
         leading_spaces = len(line) - len(line.lstrip())
         indent_level = leading_spaces // 4 if leading_spaces > 0 else (1 if line.startswith('\t') else 0)
 
+        # Each list pattern can only match if its marker is the first character
+        first = stripped[0]
+
         # Detect bullet points
-        bullet_match = re.match(r'^[\t ]*([•\-\*○▪▸►◦‣⁃])\s*(.+)$', line)
+        bullet_match = _BULLET_RE.match(line) if first in _BULLET_CHARS else None
         if bullet_match:
             bullet, content = bullet_match.groups()
             indent = '  ' * indent_level
@@ -239,7 +303,7 @@ def format_as_markdown(text):
             continue
 
         # Detect numbered lists
-        number_match = re.match(r'^[\t ]*(\d+)[.\)]\s*(.+)$', line)
+        number_match = _NUMBER_RE.match(line) if first.isdigit() else None
         if number_match:
             num, content = number_match.groups()
             indent = '  ' * indent_level
@@ -248,7 +312,7 @@ def format_as_markdown(text):
             continue
 
         # Detect lettered lists
-        letter_match = re.match(r'^[\t ]*([a-zA-Z])[.\)]\s*(.+)$', line)
+        letter_match = _LETTER_RE.match(line) if first.isascii() and first.isalpha() else None
         if letter_match and len(stripped) > 3:
             letter, content = letter_match.groups()
             indent = '  ' * indent_level
@@ -257,7 +321,7 @@ def format_as_markdown(text):
             continue
 
         # Detect checkbox items
-        checkbox_match = re.match(r'^[\t ]*\[([xX ])\]\s*(.+)$', line)
+        checkbox_match = _CHECKBOX_RE.match(line) if first == '[' else None
         if checkbox_match:
             check, content = checkbox_match.groups()
             indent = '  ' * indent_level
@@ -271,7 +335,7 @@ def format_as_markdown(text):
             len(stripped) < 60 and
             not stripped.endswith((',', '.', ':', ';', '?', '!')) and
             not stripped.startswith(('http', 'www', '@', '#')) and
-            re.match(r'^[A-Z]', stripped) and
+            'A' <= first <= 'Z' and
             i > 0):
             next_line = lines[i+1].strip() if i+1 < len(lines) else ''
             if not next_line or len(next_line) > len(stripped):
@@ -296,8 +360,8 @@ def sanitize_filename(name):
     if not name:
         return "Untitled"
     # Remove or replace invalid characters
-    name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    name = re.sub(r'\s+', ' ', name)
+    name = name.translate(_FILENAME_INVALID_TABLE)
+    name = _WHITESPACE_RE.sub(' ', name)
     name = name.strip()
     # Limit length
     if len(name) > 100:
@@ -305,6 +369,97 @@ def sanitize_filename(name):
     return name if name else "Untitled"
 
 
+def _process_note(note, folders):
+    """
+    Decode one note row and render its markdown.
+
+    Runs in a worker process, so it only computes; the parent does all
+    filesystem work.
+
+    Returns:
+        (title, folder_name, filename, content bytes) or None for skipped notes
+    """
+    note_id, snippet, folder_id, mod_date, create_date, data, mergeable_data = note
+
+    # Decode content to get real title (first line)
+    decoded_content = None
+    if data:
+        decoded_content = decode_note_content(data)
+    if not decoded_content and mergeable_data:
+        decoded_content = decode_note_content(mergeable_data)
+
+    # Extract title from first line of actual content
+    if decoded_content:
+        first_line = decoded_content.split('\n')[0].strip()
+        title = first_line if first_line else "Untitled"
+    elif snippet:
+        title = snippet.split('\n')[0].strip() if snippet else "Untitled"
+    else:
+        title = "Untitled"
+
+    if not title:
+        title = "Untitled"
+
+    # Clean title
+    title = title.replace('\x00', '').strip()
+    if not title or len(title) < 2:
+        title = "Untitled"
+
+    # Skip image-only notes
+    if title.startswith('Pasted Graphic') or title.endswith('.png') or title.endswith('.jpg'):
+        return None
+
+    # Determine folder name
+    folder_name = folders.get(folder_id, "Uncategorized")
+    folder_name = sanitize_filename(folder_name)
+
+    # Create filename with date prefix YYYYMMDD-
+    safe_title = sanitize_filename(title)
+
+    date_prefix = ""
+    if mod_date:
+        try:
+            date_prefix = mod_date[:10].replace("-", "") + "-"
+        except:
+            date_prefix = ""
+
+    filename = f"{date_prefix}{safe_title}.md"
+
+    # Build content
+    content_parts = []
+    content_parts.append(f"# {title}")
+    content_parts.append("")
+    content_parts.append(f"**Created:** {create_date}  ")
+    content_parts.append(f"**Modified:** {mod_date}  ")
+    content_parts.append(f"**Folder:** {folder_name}")
+    content_parts.append("")
+    content_parts.append("---")
+    content_parts.append("")
+
+    # Get body content (everything after first line which is the title)
+    content_found = False
+
+    if decoded_content:
+        lines = decoded_content.split('\n')
+        body = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ''
+        if body:
+            formatted_body = format_as_markdown(body)
+            content_parts.append(formatted_body)
+            content_found = True
+
+    if not content_found and snippet:
+        formatted_snippet = format_as_markdown(snippet)
+        content_parts.append(formatted_snippet)
+        content_found = True
+
+    if not content_found:
+        content_parts.append("[No content available]")
+
+    # Encode here, in the worker, so the parent writes raw bytes
+    content = '\n'.join(content_parts).encode('utf-8').replace(b'\x00', b'')
+    return title, folder_name, filename, content
+
+
 def main(output_dir=None):
     """
     Export all Apple Notes to markdown files.
@@ -332,6 +487,11 @@ def main(output_dir=None):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # Memory-map the database and enlarge the page cache (64 MB) so note
+    # BLOBs are read straight from the mapped file as rows are streamed
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+
     # Get all folders (ICFolder entities have Z_ENT = 14, use ZTITLE2)
     cursor.execute("""
         SELECT Z_PK, ZTITLE2
@@ -341,6 +501,15 @@ def main(output_dir=None):
     """)
     folders = {row[0]: row[1] for row in cursor.fetchall()}
 
+    # Count notes up front so rows can be streamed below instead of fetched
+    cursor.execute("""
+        SELECT COUNT(*)
+        FROM ZICCLOUDSYNCINGOBJECT n
+        WHERE n.Z_ENT = 11
+        AND (n.ZMARKEDFORDELETION IS NULL OR n.ZMARKEDFORDELETION != 1)
+    """)
+    note_count = cursor.fetchone()[0]
+
     # Get all notes with their content
     # ICNote entities have Z_ENT = 11
     cursor.execute("""
@@ -359,105 +528,43 @@ def main(output_dir=None):
         ORDER BY n.ZMODIFICATIONDATE1 DESC
     """)
 
-    notes = cursor.fetchall()
-    print(f"Found {len(notes)} notes to export")
+    print(f"Found {note_count} notes to export")
 
     exported_count = 0
     failed_count = 0
+    created_folders = set()
+
+    # Decoding and formatting are CPU-bound and independent per note, so fan
+    # them out to worker processes. Rows are streamed in bounded batches to
+    # keep memory flat; files are written here, in query order.
+    process = partial(_process_note, folders=folders)
+    with ProcessPoolExecutor() as executor:
+        while True:
+            rows = cursor.fetchmany(_EXPORT_BATCH_SIZE)
+            if not rows:
+                break
 
-    for note in notes:
-        note_id, snippet, folder_id, mod_date, create_date, data, mergeable_data = note
-
-        # Decode content to get real title (first line)
-        decoded_content = None
-        if data:
-            decoded_content = decode_note_content(data)
-        if not decoded_content and mergeable_data:
-            decoded_content = decode_note_content(mergeable_data)
-
-        # Extract title from first line of actual content
-        if decoded_content:
-            first_line = decoded_content.split('\n')[0].strip()
-            title = first_line if first_line else "Untitled"
-        elif snippet:
-            title = snippet.split('\n')[0].strip() if snippet else "Untitled"
-        else:
-            title = "Untitled"
-
-        if not title:
-            title = "Untitled"
-
-        # Clean title
-        title = title.replace('\x00', '').strip()
-        if not title or len(title) < 2:
-            title = "Untitled"
-
-        # Skip image-only notes
-        if title.startswith('Pasted Graphic') or title.endswith('.png') or title.endswith('.jpg'):
-            continue
-
-        # Determine folder name
-        folder_name = folders.get(folder_id, "Uncategorized")
-        folder_name = sanitize_filename(folder_name)
-
-        # Create folder directory
-        note_folder = export_dir / folder_name
-        note_folder.mkdir(exist_ok=True)
-
-        # Create filename with date prefix YYYYMMDD-
-        safe_title = sanitize_filename(title)
-
-        date_prefix = ""
-        if mod_date:
-            try:
-                date_prefix = mod_date[:10].replace("-", "") + "-"
-            except:
-                date_prefix = ""
-
-        filename = f"{date_prefix}{safe_title}.md"
-        filepath = note_folder / filename
-
-        # Build content
-        content_parts = []
-        content_parts.append(f"# {title}")
-        content_parts.append("")
-        content_parts.append(f"**Created:** {create_date}  ")
-        content_parts.append(f"**Modified:** {mod_date}  ")
-        content_parts.append(f"**Folder:** {folder_name}")
-        content_parts.append("")
-        content_parts.append("---")
-        content_parts.append("")
-
-        # Get body content (everything after first line which is the title)
-        content_found = False
-
-        if decoded_content:
-            lines = decoded_content.split('\n')
-            body = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ''
-            if body:
-                formatted_body = format_as_markdown(body)
-                content_parts.append(formatted_body)
-                content_found = True
-
-        if not content_found and snippet:
-            formatted_snippet = format_as_markdown(snippet)
-            content_parts.append(formatted_snippet)
-            content_found = True
-
-        if not content_found:
-            content_parts.append("[No content available]")
-
-        # Write to file
-        try:
-            content = '\n'.join(content_parts)
-            content = content.replace('\x00', '')
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            exported_count += 1
-            print(f"Exported: {folder_name}/{filename}")
-        except Exception as e:
-            print(f"Failed to export '{title}': {e}")
-            failed_count += 1
+            for result in executor.map(process, rows, chunksize=16):
+                if result is None:
+                    continue
+                title, folder_name, filename, content = result
+
+                # Create folder directory (once per folder, not per note)
+                note_folder = export_dir / folder_name
+                if folder_name not in created_folders:
+                    note_folder.mkdir(exist_ok=True)
+                    created_folders.add(folder_name)
+                filepath = note_folder / filename
+
+                # Write to file
+                try:
+                    with open(filepath, 'wb') as f:
+                        f.write(content)
+                    exported_count += 1
+                    print(f"Exported: {folder_name}/{filename}")
+                except Exception as e:
+                    print(f"Failed to export '{title}': {e}")
+                    failed_count += 1
 
     conn.close()
 
@@ -0,0 +1,85 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled UTF-8 byte normalizer for fix_docx_chars.py.
+
+Applies the same mappings as fix_docx_chars._REPLACEMENTS directly to
+UTF-8 bytes, without decoding to str. Input must be valid UTF-8.
+Build in place with:  cythonize -i scripts/_fix_chars.pyx
+"""
+
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from libc.string cimport memcpy
+
+
+cdef inline Py_ssize_t _put(char* out, Py_ssize_t o, const char* s, Py_ssize_t k) noexcept nogil:
+    memcpy(out + o, s, k)
+    return o + k
+
+
+def normalize_bytes(const unsigned char[::1] buf):
+    """Return buf with Word special characters replaced, as UTF-8 bytes."""
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i = 0, o = 0
+    cdef unsigned char b, b1, b2
+    # Every replacement is no longer than the sequence it replaces
+    result = PyBytes_FromStringAndSize(NULL, n)
+    cdef char* out = PyBytes_AS_STRING(result)
+
+    with nogil:
+        while i < n:
+            b = buf[i]
+            if b < 0x80:
+                out[o] = <char>b
+                o += 1
+                i += 1
+                continue
+
+            if (b == 0xC2 or b == 0xC3) and i + 1 < n:
+                b1 = buf[i + 1]
+                if b == 0xC2 and b1 == 0xA0:      # U+00A0 no-break space
+                    o = _put(out, o, b" ", 1); i += 2; continue
+                if b == 0xC2 and b1 == 0xB7:      # U+00B7 middle dot
+                    o = _put(out, o, b"*", 1); i += 2; continue
+                if b == 0xC3 and b1 == 0x97:      # U+00D7 multiplication sign
+                    o = _put(out, o, b"x", 1); i += 2; continue
+                if b == 0xC3 and b1 == 0xB7:      # U+00F7 division sign
+                    o = _put(out, o, b"/", 1); i += 2; continue
+
+            elif b == 0xE2 and i + 2 < n:
+                b1 = buf[i + 1]
+                b2 = buf[i + 2]
+                if b1 == 0x80:
+                    if b2 == 0x9C or b2 == 0x9D:                  # U+201C/D double quotes
+                        o = _put(out, o, b'"', 1); i += 3; continue
+                    if b2 == 0x98 or b2 == 0x99 or b2 == 0x9B:    # U+2018/9/B single quotes
+                        o = _put(out, o, b"'", 1); i += 3; continue
+                    if b2 == 0x93 or b2 == 0x94:                  # U+2013/4 en/em dash
+                        o = _put(out, o, b"-", 1); i += 3; continue
+                    if b2 == 0xAF or b2 == 0x89:                  # U+202F/U+2009 narrow spaces
+                        o = _put(out, o, b" ", 1); i += 3; continue
+                    if b2 == 0xA6:                                # U+2026 ellipsis
+                        o = _put(out, o, b"...", 3); i += 3; continue
+                    if b2 == 0xA2:                                # U+2022 bullet
+                        o = _put(out, o, b"*", 1); i += 3; continue
+                elif b1 == 0x88 and b2 == 0x92:                   # U+2212 minus sign
+                    o = _put(out, o, b"-", 1); i += 3; continue
+                elif b1 == 0x86 and b2 == 0x92:                   # U+2192 rightwards arrow
+                    o = _put(out, o, b"->", 2); i += 3; continue
+                elif b1 == 0x86 and b2 == 0x90:                   # U+2190 leftwards arrow
+                    o = _put(out, o, b"<-", 2); i += 3; continue
+                elif b1 == 0x87 and b2 == 0x92:                   # U+21D2 rightwards double arrow
+                    o = _put(out, o, b"=>", 2); i += 3; continue
+                elif b1 == 0x89:
+                    if b2 == 0x88:                                # U+2248 almost equal
+                        o = _put(out, o, b"~=", 2); i += 3; continue
+                    if b2 == 0xA4:                                # U+2264 less-than or equal
+                        o = _put(out, o, b"<=", 2); i += 3; continue
+                    if b2 == 0xA5:                                # U+2265 greater-than or equal
+                        o = _put(out, o, b">=", 2); i += 3; continue
+
+            # Any other byte is copied through unchanged
+            out[o] = <char>b
+            o += 1
+            i += 1
+
+    return result[:o]
@@ -14,8 +14,10 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 import re
+import zipfile
 from pathlib import Path
 
 # Add venv to path
@@ -24,30 +26,86 @@ for p in venv_path.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
 from docx import Document
+from docx.oxml import parse_xml
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.text.paragraph import Paragraph
+
+
+# Special characters mapped to standard equivalents, applied in one pass
+_NORMALIZE_TABLE = str.maketrans({
+    '\u2018': "'",   # Left single quote
+    '\u2019': "'",   # Right single quote
+    '\u201C': '"',   # Left double quote
+    '\u201D': '"',   # Right double quote
+    '\u2013': '-',   # En dash
+    '\u2014': '-',   # Em dash
+    '\u2026': '...', # Ellipsis
+    '\u00A0': ' ',   # Non-breaking space
+})
 
 
 def normalize_text(text):
     """Normalize special characters to standard equivalents for matching."""
-    replacements = {
-        '\u2018': "'",   # Left single quote
-        '\u2019': "'",   # Right single quote
-        '\u201C': '"',   # Left double quote
-        '\u201D': '"',   # Right double quote
-        '\u2013': '-',   # En dash
-        '\u2014': '-',   # Em dash
-        '\u2026': '...', # Ellipsis
-        '\u00A0': ' ',   # Non-breaking space
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    return text.translate(_NORMALIZE_TABLE)
+
+
+# Parsed documents for read-only access, keyed by path -> (mtime_ns, Document)
+_doc_cache = {}
+_DOC_CACHE_SIZE = 8
+
+
+def get_doc(filepath):
+    """
+    Return a parsed Document for read-only use, reusing the previous parse
+    while the file is unchanged on disk.
+
+    Editing commands open their own Document, since they mutate it and may
+    save elsewhere with --output.
+    """
+    key = os.path.abspath(filepath)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _doc_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    doc = Document(filepath)
+    _doc_cache.pop(key, None)
+    if len(_doc_cache) >= _DOC_CACHE_SIZE:
+        # Evict the least recently parsed document
+        del _doc_cache[next(iter(_doc_cache))]
+    _doc_cache[key] = (mtime, doc)
+    return doc
+
+
+_OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+
+def _iter_paragraph_text(filepath):
+    """
+    Yield the text of each body paragraph, numbered as in doc.paragraphs.
+
+    Reads only the main document part from the .docx zip, skipping the
+    package, style and relationship loading that Document() does. Text
+    comes from python-docx's own paragraph element, so tabs, breaks and
+    hyperlinks render exactly as para.text does.
+    """
+    with zipfile.ZipFile(filepath) as z:
+        part_name = "word/document.xml"
+        rels = parse_xml(z.read("_rels/.rels"))
+        for rel in rels:
+            if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+                part_name = rel.get("Target").lstrip("/")
+                break
+        document = parse_xml(z.read(part_name))
+
+    for p in document.body.p_lst:
+        yield Paragraph(p, None).text
 
 
 def read_document(filepath):
     """Read and display document content with paragraph numbers."""
-    doc = Document(filepath)
+    doc = get_doc(filepath)
     print(f"\n=== Document: {filepath} ===\n")
 
     for i, para in enumerate(doc.paragraphs):
@@ -70,22 +128,29 @@ def read_document(filepath):
     return doc
 
 
-def search_document(filepath, search_text):
-    """Search for text in document and show context."""
-    doc = Document(filepath)
-    search_lower = search_text.lower()
-    search_normalized = normalize_text(search_text.lower())
+def _find_matches(paragraphs, search_lower, search_normalized):
+    """Return (paragraph number, text) for each matching paragraph."""
     found = []
-
-    for i, para in enumerate(doc.paragraphs):
-        text = para.text
+    for i, text in enumerate(paragraphs):
         text_lower = text.lower()
         text_normalized = normalize_text(text_lower)
 
         if search_lower in text_lower or search_normalized in text_normalized:
             found.append((i, text))
-            print(f"\n[P{i}] Found match:")
-            print(f"    {text[:1000]}")
+    return found
+
+
+def search_document(filepath, search_text):
+    """Search for text in document and show context."""
+    search_lower = search_text.lower()
+    search_normalized = normalize_text(search_text.lower())
+
+    # Only paragraph text is needed, so skip building the full document model
+    found = _find_matches(_iter_paragraph_text(filepath), search_lower, search_normalized)
+
+    for i, text in found:
+        print(f"\n[P{i}] Found match:")
+        print(f"    {text[:1000]}")
 
     if not found:
         print(f"No matches found for: {search_text}")
@@ -95,15 +160,23 @@ def search_document(filepath, search_text):
     return found
 
 
-def replace_text_in_paragraph(para, old_text, new_text):
-    """Replace text in a paragraph while preserving formatting as much as possible."""
-    # Check if old_text exists in the paragraph
-    full_text = para.text
-    normalized_full = normalize_text(full_text)
-    normalized_old = normalize_text(old_text)
+def replace_text_in_paragraph(para, old_text, new_text, normalized_old=None):
+    """Replace text in a paragraph while preserving formatting as much as possible.
 
-    if old_text not in full_text and normalized_old not in normalized_full:
-        return False
+    normalized_old may be passed in by callers that replace the same text in
+    many paragraphs, so it is only normalized once.
+    """
+    if normalized_old is None:
+        normalized_old = normalize_text(old_text)
+
+    # Check if old_text exists in the paragraph (one scan of the raw text,
+    # and a normalized scan only when the exact text is absent)
+    full_text = para.text
+    exact_match = old_text in full_text
+    if not exact_match:
+        normalized_full = normalize_text(full_text)
+        if normalized_old not in normalized_full:
+            return False
 
     # For simple replacements, try to do it run by run first
     for run in para.runs:
@@ -116,51 +189,49 @@ def replace_text_in_paragraph(para, old_text, new_text):
             run.text = normalized_run.replace(normalized_old, new_text)
             return True
 
-    # If text spans multiple runs, we need to rebuild
-    if old_text in full_text or normalized_old in normalized_full:
-        # Get the first run's formatting to preserve
-        if para.runs:
-            # Store formatting from first run
-            first_run = para.runs[0]
-            font_name = first_run.font.name
-            font_size = first_run.font.size
-            bold = first_run.font.bold
-            italic = first_run.font.italic
-
-        # Do the replacement
-        if old_text in full_text:
-            new_full = full_text.replace(old_text, new_text)
-        else:
-            new_full = normalized_full.replace(normalized_old, new_text)
-
-        # Clear all runs and add new text
-        for run in para.runs:
-            run.text = ""
-        if para.runs:
-            para.runs[0].text = new_full
-            # Restore formatting
-            if font_name:
-                para.runs[0].font.name = font_name
-            if font_size:
-                para.runs[0].font.size = font_size
-            if bold is not None:
-                para.runs[0].font.bold = bold
-            if italic is not None:
-                para.runs[0].font.italic = italic
-        else:
-            para.add_run(new_full)
-        return True
-
-    return False
+    # Text spans multiple runs (already known to be present), so rebuild
+    # Get the first run's formatting to preserve
+    if para.runs:
+        # Store formatting from first run
+        first_run = para.runs[0]
+        font_name = first_run.font.name
+        font_size = first_run.font.size
+        bold = first_run.font.bold
+        italic = first_run.font.italic
+
+    # Do the replacement
+    if exact_match:
+        new_full = full_text.replace(old_text, new_text)
+    else:
+        new_full = normalized_full.replace(normalized_old, new_text)
+
+    # Clear all runs and add new text
+    for run in para.runs:
+        run.text = ""
+    if para.runs:
+        para.runs[0].text = new_full
+        # Restore formatting
+        if font_name:
+            para.runs[0].font.name = font_name
+        if font_size:
+            para.runs[0].font.size = font_size
+        if bold is not None:
+            para.runs[0].font.bold = bold
+        if italic is not None:
+            para.runs[0].font.italic = italic
+    else:
+        para.add_run(new_full)
+    return True
 
 
 def replace_text(filepath, old_text, new_text, output_path=None):
     """Find and replace text throughout document."""
     doc = Document(filepath)
     count = 0
+    normalized_old = normalize_text(old_text)
 
     for para in doc.paragraphs:
-        if replace_text_in_paragraph(para, old_text, new_text):
+        if replace_text_in_paragraph(para, old_text, new_text, normalized_old):
             count += 1
 
     # Also check tables
@@ -168,7 +239,7 @@ def replace_text(filepath, old_text, new_text, output_path=None):
         for row in table.rows:
             for cell in row.cells:
                 for para in cell.paragraphs:
-                    if replace_text_in_paragraph(para, old_text, new_text):
+                    if replace_text_in_paragraph(para, old_text, new_text, normalized_old):
                         count += 1
 
     if output_path:
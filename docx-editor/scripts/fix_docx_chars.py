@@ -8,6 +8,54 @@ non-standard characters (smart quotes, em dashes, etc.) in .docx files.
 import sys
 from pathlib import Path
 
+try:
+    # Optional compiled byte normalizer (build with: cythonize -i scripts/_fix_chars.pyx)
+    from _fix_chars import normalize_bytes as _fast_normalize_bytes
+    HAS_FAST_NORMALIZE = True
+except ImportError:
+    HAS_FAST_NORMALIZE = False
+
+# Word special characters and their plain-text equivalents
+_REPLACEMENTS = {
+    # Smart quotes
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201b': "'",  # Single high-reversed-9 quotation mark
+
+    # Dashes
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2212': '-',  # Minus sign
+
+    # Spaces
+    '\u00a0': ' ',  # Non-breaking space
+    '\u202f': ' ',  # Narrow no-break space
+    '\u2009': ' ',  # Thin space
+
+    # Other punctuation
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u2022': '*',    # Bullet
+    '\u00b7': '*',    # Middle dot
+
+    # Arrows
+    '\u2192': '->',   # Rightwards arrow
+    '\u21d2': '=>',   # Rightwards double arrow
+    '\u2190': '<-',   # Leftwards arrow
+
+    # Mathematical
+    '\u2248': '~=',   # Almost equal to
+    '\u00d7': 'x',    # Multiplication sign
+    '\u00f7': '/',    # Division sign
+    '\u2264': '<=',   # Less-than or equal to
+    '\u2265': '>=',   # Greater-than or equal to
+}
+
+# Built once at import; str.translate applies every mapping in one pass
+_TRANSLATE_TABLE = str.maketrans(_REPLACEMENTS)
+
+
 def normalize_word_chars(text):
     """
     Convert Word's special characters to standard Unicode equivalents.
@@ -18,46 +66,15 @@ def normalize_word_chars(text):
     Returns:
         String with normalized characters
     """
-    replacements = {
-        # Smart quotes
-        '\u201c': '"',  # Left double quotation mark
-        '\u201d': '"',  # Right double quotation mark
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201b': "'",  # Single high-reversed-9 quotation mark
-
-        # Dashes
-        '\u2013': '-',  # En dash
-        '\u2014': '-',  # Em dash
-        '\u2212': '-',  # Minus sign
-
-        # Spaces
-        '\u00a0': ' ',  # Non-breaking space
-        '\u202f': ' ',  # Narrow no-break space
-        '\u2009': ' ',  # Thin space
-
-        # Other punctuation
-        '\u2026': '...',  # Horizontal ellipsis
-        '\u2022': '*',    # Bullet
-        '\u00b7': '*',    # Middle dot
-
-        # Arrows
-        '\u2192': '->',   # Rightwards arrow
-        '\u21d2': '=>',   # Rightwards double arrow
-        '\u2190': '<-',   # Leftwards arrow
-
-        # Mathematical
-        '\u2248': '~=',   # Almost equal to
-        '\u00d7': 'x',    # Multiplication sign
-        '\u00f7': '/',    # Division sign
-        '\u2264': '<=',   # Less-than or equal to
-        '\u2265': '>=',   # Greater-than or equal to
-    }
-
-    for old_char, new_char in replacements.items():
-        text = text.replace(old_char, new_char)
-
-    return text
+    # Every mapped character is non-ASCII, and str.isascii() is O(1)
+    if text.isascii():
+        return text
+    return text.translate(_TRANSLATE_TABLE)
+
+
+def _is_utf8(stream):
+    """True if a text stream encodes as UTF-8."""
+    return (stream.encoding or '').lower().replace('-', '') == 'utf8'
 
 
 def main():
@@ -70,12 +87,28 @@ def main():
         print('  echo "Text with — special chars" | python3 fix_docx_chars.py -')
         sys.exit(1)
 
-    # Read from stdin if argument is '-'
+    # Stream stdin line by line if argument is '-', so large inputs are
+    # never held in memory at once. Both paths copy line endings and any
+    # bytes that aren't valid in the input encoding through unchanged
     if sys.argv[1] == '-':
-        text = sys.stdin.read()
-    else:
-        text = ' '.join(sys.argv[1:])
-
+        if HAS_FAST_NORMALIZE and _is_utf8(sys.stdin) and _is_utf8(sys.stdout):
+            # Work on raw UTF-8 bytes; lines never split a multi-byte sequence
+            write = sys.stdout.buffer.write
+            for line in sys.stdin.buffer:
+                write(_fast_normalize_bytes(line))
+            write(b'\n')
+            return
+
+        # surrogateescape round-trips undecodable bytes, as the byte path does
+        sys.stdin.reconfigure(errors='surrogateescape')
+        sys.stdout.reconfigure(errors='surrogateescape')
+        write = sys.stdout.write
+        for line in sys.stdin:
+            write(normalize_word_chars(line))
+        write('\n')
+        return
+
+    text = ' '.join(sys.argv[1:])
     normalized = normalize_word_chars(text)
     print(normalized)
 
@@ -0,0 +1,51 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled per-message helpers for gmail_utils.py.
+
+Mirror _pick_headers() and _find_body_parts(), which run once per message
+in search and read. Build in place with:  cythonize -i scripts/gmail_fast.pyx
+"""
+
+
+def pick_headers(list headers, dict wanted):
+    """Collect the wanted headers (case-insensitive) from a payload header list."""
+    cdef dict picked = {}
+    cdef dict h
+    cdef object name
+    cdef Py_ssize_t remaining = len(wanted)
+    for h in headers:
+        name = wanted.get((<str>h['name']).lower())
+        if name is not None and name not in picked:
+            picked[name] = h['value']
+            remaining -= 1
+            if remaining == 0:
+                break
+    return picked
+
+
+def find_body_parts(dict payload):
+    """Return the base64url data of the first text/plain and text/html body parts."""
+    cdef object plain_data = None
+    cdef object html_data = None
+    cdef list stack = [payload]
+    cdef dict part
+    cdef str mime_type
+    cdef object data
+    cdef list parts
+    cdef Py_ssize_t i
+
+    while stack and (plain_data is None or html_data is None):
+        part = stack.pop()
+        mime_type = part.get('mimeType', '')
+        data = part.get('body', {}).get('data')
+        if data and not part.get('filename'):
+            if plain_data is None and mime_type == 'text/plain':
+                plain_data = data
+            elif html_data is None and mime_type == 'text/html':
+                html_data = data
+        # Descend into the top level and multipart containers only
+        if part is payload or mime_type.startswith('multipart/'):
+            parts = part.get('parts', [])
+            for i in range(len(parts) - 1, -1, -1):
+                stack.append(parts[i])
+    return plain_data, html_data
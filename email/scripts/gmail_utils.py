@@ -3,38 +3,80 @@
 
 import argparse
 import base64
+import binascii
+import io
 import json
 import os
+import re
 import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email.mime.application import MIMEApplication
-from email import encoders
+from email.utils import getaddresses
 import mimetypes
 import html as html_module
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
+
+
+def _missing_dependency(e: ImportError) -> SystemExit:
+    """Exit error for a missing Google client library.
+
+    The Google libraries are imported on first API use (get_credentials(),
+    get_gmail_service()), so --help and argument errors never load them.
+    """
+    return SystemExit(
+        f"Missing dependency ({e.name}). Install with:\n"
+        "  pip install google-auth google-auth-oauthlib google-api-python-client"
+    )
+
+
+# bs4 (and lxml) are only probed here; bs4 is imported on first use in
+# extract_body_both() so commands that never convert HTML don't pay for it
+HAS_BS4 = find_spec('bs4') is not None
+
+# lxml's C parser is much faster than bs4's pure-Python html.parser
+BS4_PARSER = 'lxml' if find_spec('lxml') is not None else 'html.parser'
+
+# API responses are parsed with orjson when available (several times faster
+# than json on large messages.get payloads)
+try:
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    print("Installing required packages...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-q",
-                          "google-auth", "google-auth-oauthlib", "google-api-python-client"])
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
+    HAS_ORJSON = False
+
+
+def _orjson_model():
+    """Return a JsonModel that deserializes API responses with orjson."""
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Same fallback as JsonModel: hand back non-JSON content as text
+                return super().deserialize(content)
+            if self._data_wrapper and 'data' in body:
+                body = body['data']
+            return body
+
+    return _OrjsonModel()
+
 
 try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
+    # Optional compiled helpers (build with: cythonize -i scripts/gmail_fast.pyx)
+    from gmail_fast import pick_headers as _fast_pick_headers
+    from gmail_fast import find_body_parts as _fast_find_body_parts
+    HAS_FAST_MIME = True
 except ImportError:
-    HAS_BS4 = False
+    HAS_FAST_MIME = False
 
 # Paths to OAuth credentials
 # NOTE: Account keys below are user-defined. Rename them and their corresponding
@@ -64,23 +106,51 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.compose',
 ]
 
+# First bare email address anywhere in a header value
+_BARE_ADDR_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+# Any run of leading "Re:" prefixes on a subject, in any case
+_RE_PREFIX_RE = re.compile(r'^(?:re:\s*)+', re.IGNORECASE)
+# Any of the tags that mark a body as already-formatted HTML
+_HTML_BODY_RE = re.compile(r'<(?:a |b>|ul>|li>|br>|p>|h|ol>|blockquote)')
+
+# _html_to_plain() passes, in the order they are applied
+_BR_TAG_RE = re.compile(r'(?i)<\s*br\s*/?\s*>')
+_BLOCK_CLOSE_RE = re.compile(r'(?i)</\s*(p|div|li|h[1-6]|ol|ul|blockquote|tr)\s*>')
+_LI_OPEN_RE = re.compile(r'(?i)<\s*li[^>]*>')
+_ANY_TAG_RE = re.compile(r'<[^>]+>')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
 
 def get_token_path():
     """Get the token path for the current account."""
     return ACCOUNT_TOKENS.get(CURRENT_ACCOUNT, TOKEN_PATH)
 
 
-def get_credentials() -> Credentials:
-    """Load and refresh OAuth credentials, or run auth flow if needed."""
-    creds = None
+_CREDS_CACHE = {}
+
+
+def get_credentials() -> "Credentials":
+    """Load and refresh OAuth credentials, or run auth flow if needed.
+
+    Credentials are cached per account, so token.json is only read on the
+    first call and only rewritten when the token actually changes.
+    """
+    try:
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+    except ImportError as e:
+        raise _missing_dependency(e)
+
     token_path = get_token_path()
+    creds = _CREDS_CACHE.get(CURRENT_ACCOUNT)
 
     # Load existing token
-    if token_path.exists():
+    if creds is None and token_path.exists():
         creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
 
     # Refresh or get new credentials
     if not creds or not creds.valid:
+        old_token = creds.token if creds else None
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
@@ -89,31 +159,144 @@ def get_credentials() -> Credentials:
                     f"credentials.json not found at {CREDENTIALS_PATH}\n"
                     "Download OAuth credentials from Google Cloud Console."
                 )
+            from google_auth_oauthlib.flow import InstalledAppFlow
             flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_PATH), SCOPES)
             print(f"Opening browser to authorize account ({CURRENT_ACCOUNT})...")
             creds = flow.run_local_server(port=0)
+            # A different Google account may have been authorized
+            _self_email_path().unlink(missing_ok=True)
+            _SELF_EMAIL_CACHE.pop(CURRENT_ACCOUNT, None)
 
         # Save credentials
-        with open(token_path, 'w') as f:
-            f.write(creds.to_json())
-        print(f"Token saved to {token_path}")
+        if creds.token != old_token:
+            with open(token_path, 'w') as f:
+                f.write(creds.to_json())
+            print(f"Token saved to {token_path}")
 
+    _CREDS_CACHE[CURRENT_ACCOUNT] = creds
     return creds
 
 
+# Seconds before an API request times out
+HTTP_TIMEOUT = 30
+
+_SERVICE_CACHE = {}
+
+
 def get_gmail_service():
-    """Build and return Gmail API service."""
-    creds = get_credentials()
-    return build('gmail', 'v1', credentials=creds)
+    """Build and return Gmail API service (built once per account per process).
+
+    The service keeps a single authorized Http, so list/get sequences and
+    batch requests reuse its keep-alive connection instead of reconnecting.
+    """
+    key = CURRENT_ACCOUNT
+    if key not in _SERVICE_CACHE:
+        creds = get_credentials()
+        try:
+            from googleapiclient.discovery import build, build_from_document
+            from googleapiclient.discovery_cache import get_static_doc
+            from google_auth_httplib2 import AuthorizedHttp
+            from httplib2 import Http
+        except ImportError as e:
+            raise _missing_dependency(e)
+
+        http = AuthorizedHttp(creds, http=Http(timeout=HTTP_TIMEOUT))
+        model = _orjson_model() if HAS_ORJSON else None
+        # Use the discovery document bundled with googleapiclient, not an HTTP
+        # fetch, and parse it here (with orjson when available) so build()'s
+        # URL templating and retrieval steps are skipped
+        doc = get_static_doc('gmail', 'v1')
+        if doc is not None:
+            doc = orjson.loads(doc) if HAS_ORJSON else json.loads(doc)
+            service = build_from_document(doc, http=http, model=model)
+        else:
+            service = build('gmail', 'v1', http=http, model=model, static_discovery=True)
+        _SERVICE_CACHE[key] = service
+    return _SERVICE_CACHE[key]
+
+
+# Partial-response masks: only the fields the functions below actually read
+MESSAGE_LIST_FIELDS = 'messages(id)'
+MESSAGE_DATE_FIELDS = 'id,internalDate'
+MESSAGE_HEADERS_FIELDS = 'id,threadId,internalDate,snippet,payload/headers'
+MESSAGE_DATED_HEADERS_FIELDS = 'internalDate,payload/headers'
+# For body reads: the MIME tree keeps only what _find_body_parts() walks
+# (mimeType, filename, inline body data or the attachmentId Gmail uses for
+# large bodies, child parts), so attachment metadata and the per-part headers
+# are stripped server-side. Nesting beyond four levels is returned whole.
+MESSAGE_FULL_FIELDS = ('id,threadId,internalDate,snippet,payload(headers,mimeType,filename,'
+                       'body(data,attachmentId),parts(mimeType,filename,body(data,attachmentId),'
+                       'parts(mimeType,filename,body(data,attachmentId),'
+                       'parts(mimeType,filename,body(data,attachmentId),parts))))')
+
+# Headers shown in search results
+SEARCH_HEADERS = ['From', 'To', 'Cc', 'Bcc', 'Subject', 'Date']
+
+
+def _header_names(*names):
+    """Map lowercased header names to the spelling callers look them up by."""
+    return {name.lower(): name for name in names}
+
+
+_SEARCH_HEADER_NAMES = _header_names(*SEARCH_HEADERS)
+_REPLY_HEADER_NAMES = _header_names('From', 'To', 'Subject', 'Date', 'Message-ID', 'References')
+
+
+def _pick_headers(headers, wanted):
+    """Collect just the wanted headers from a Gmail payload header list.
+
+    Matches names case-insensitively (senders use both Message-ID and
+    Message-Id) and skips every other header, e.g. long Received chains.
+    The first occurrence of a header wins, and the scan stops once every
+    wanted header has been found.
+
+    Args:
+        headers: payload['headers'] list of {'name', 'value'} dicts
+        wanted: dict from _header_names()
+
+    Returns:
+        Dict of header values keyed by the names in wanted
+    """
+    if HAS_FAST_MIME:
+        return _fast_pick_headers(headers, wanted)
+
+    picked = {}
+    remaining = len(wanted)
+    for h in headers:
+        name = wanted.get(h['name'].lower())
+        if name is not None and name not in picked:
+            picked[name] = h['value']
+            remaining -= 1
+            if not remaining:
+                break
+    return picked
+
+
+_MESSAGE_CACHE = {}
+
+
+def _get_message(service, message_id: str, **get_kwargs):
+    """messages.get, cached per account for the life of the process.
+
+    Replying reads the target message both to check it is the latest
+    (redirect_replyto_to_latest) and to quote it (get_email_for_reply); the
+    cache makes that a single fetch.
+    """
+    key = (CURRENT_ACCOUNT, message_id,
+           tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in get_kwargs.items())))
+    msg_data = _MESSAGE_CACHE.get(key)
+    if msg_data is None:
+        msg_data = service.users().messages().get(userId='me', id=message_id, **get_kwargs).execute()
+        _MESSAGE_CACHE[key] = msg_data
+    return msg_data
 
 
 def get_email_for_reply(service, message_id: str):
     """Fetch email details needed for a reply."""
-    msg_data = service.users().messages().get(
-        userId='me', id=message_id, format='full'
-    ).execute()
+    msg_data = _get_message(service, message_id, format='full', fields=MESSAGE_FULL_FIELDS)
 
-    headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
+    headers = _pick_headers(msg_data['payload']['headers'], _REPLY_HEADER_NAMES)
+    _load_large_body_parts(service, message_id, msg_data['payload'])
     body_text, body_html = extract_body_both(msg_data['payload'])
 
     return {
@@ -136,19 +319,18 @@ def _html_to_plain(html: str) -> str:
     Preserves paragraph and list breaks; strips tags; unescapes entities.
     Intentionally simple: no inline images, no tables, no CSS.
     """
-    import re
     text = html
     # Block-level closers and <br> become newlines
-    text = re.sub(r'(?i)<\s*br\s*/?\s*>', '\n', text)
-    text = re.sub(r'(?i)</\s*(p|div|li|h[1-6]|ol|ul|blockquote|tr)\s*>', '\n', text)
+    text = _BR_TAG_RE.sub('\n', text)
+    text = _BLOCK_CLOSE_RE.sub('\n', text)
     # Opening list-item gets a bullet
-    text = re.sub(r'(?i)<\s*li[^>]*>', '- ', text)
+    text = _LI_OPEN_RE.sub('- ', text)
     # Drop all remaining tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _ANY_TAG_RE.sub('', text)
     # Unescape entities (&amp;, &lt;, &nbsp; etc.)
     text = html_module.unescape(text)
     # Collapse 3+ consecutive newlines to two
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_RUN_RE.sub('\n\n', text)
     return text.strip()
 
 
@@ -198,20 +380,21 @@ def validate_attachment_integrity(filepath: str, data: bytes) -> str:
     return None
 
 
-def format_quoted_reply(original_email: dict) -> str:
-    """Format the original email as a quoted reply (plain text fallback)."""
-    quoted_lines = []
-    quoted_lines.append(f"\n\nOn {original_email['date']}, {original_email['from']} wrote:\n")
+def _quoted_reply_parts(original_email: dict) -> list:
+    """Pieces of the plain-text quoted reply, for joining onto a reply body."""
+    header = f"\n\nOn {original_email['date']}, {original_email['from']} wrote:\n\n> "
 
-    # Quote each line of the original body
-    for line in original_email['body'].split('\n'):
-        quoted_lines.append(f"> {line}")
+    # Quote each line of the original body in one pass over the string
+    return [header, original_email['body'].replace('\n', '\n> ')]
 
-    return '\n'.join(quoted_lines)
 
+def format_quoted_reply(original_email: dict) -> str:
+    """Format the original email as a quoted reply (plain text fallback)."""
+    return ''.join(_quoted_reply_parts(original_email))
 
-def format_quoted_reply_html(original_email: dict) -> str:
-    """Format the original email as an HTML quoted reply, preserving formatting."""
+
+def _quoted_reply_html_parts(original_email: dict) -> list:
+    """Pieces of the HTML quoted reply, for joining onto a reply body."""
     from_addr = html_module.escape(original_email['from'])
     date = html_module.escape(original_email['date'])
 
@@ -223,13 +406,18 @@ def format_quoted_reply_html(original_email: dict) -> str:
         escaped = html_module.escape(original_email['body'])
         quoted_content = escaped.replace('\n', '<br>\n')
 
-    return f'''<br><br>
+    return [f'''<br><br>
 <div class="gmail_quote">
 <div dir="ltr" class="gmail_attr">On {date}, {from_addr} wrote:<br></div>
 <blockquote class="gmail_quote" style="margin:0px 0px 0px 0.8ex;border-left:1px solid rgb(204,204,204);padding-left:1ex">
-{quoted_content}
+''', quoted_content, '''
 </blockquote>
-</div>'''
+</div>''']
+
+
+def format_quoted_reply_html(original_email: dict) -> str:
+    """Format the original email as an HTML quoted reply, preserving formatting."""
+    return ''.join(_quoted_reply_html_parts(original_email))
 
 
 def find_latest_thread_message(service, email_address: str) -> str:
@@ -237,31 +425,32 @@ def find_latest_thread_message(service, email_address: str) -> str:
 
     Note: Gmail's OR operator prioritizes left-side matches, so we run separate
     queries for 'from:' and 'to:' and return the most recent across both.
+    threads.list/threads.get is not used: a thread's newest message may be a
+    draft or come from someone else on the thread, and it would take the same
+    two round trips (the list calls share one batch, as do the date lookups).
     """
-    # Run separate queries to avoid Gmail OR prioritization bug.
+    # Run separate queries to avoid Gmail OR prioritization bug; both go out
+    # in one batch request.
     # Exclude drafts and chats: a half-written draft to this person must never
     # become a reply target (its unsent content would leak into the quote).
-    from_results = service.users().messages().list(
-        userId='me', q=f"from:{email_address} -in:drafts -in:chats", maxResults=1
-    ).execute()
-
-    to_results = service.users().messages().list(
-        userId='me', q=f"to:{email_address} -in:drafts -in:chats", maxResults=1
-    ).execute()
+    from_results, to_results = _batch_execute(service, [
+        service.users().messages().list(
+            userId='me', q=f"{direction}:{email_address} -in:drafts -in:chats", maxResults=1,
+            fields=MESSAGE_LIST_FIELDS
+        )
+        for direction in ('from', 'to')
+    ])
 
     from_msgs = from_results.get('messages', [])
     to_msgs = to_results.get('messages', [])
 
     # If we have results from both, compare internal dates to find most recent
+    # (both lookups share one batch request)
     if from_msgs and to_msgs:
-        from_msg = service.users().messages().get(
-            userId='me', id=from_msgs[0]['id'], format='metadata',
-            metadataHeaders=['Date']
-        ).execute()
-        to_msg = service.users().messages().get(
-            userId='me', id=to_msgs[0]['id'], format='metadata',
-            metadataHeaders=['Date']
-        ).execute()
+        from_msg, to_msg = _batch_get_messages(
+            service, [from_msgs[0]['id'], to_msgs[0]['id']], format='minimal',
+            fields=MESSAGE_DATE_FIELDS
+        )
         # Use internalDate (milliseconds since epoch) for comparison
         if int(from_msg.get('internalDate', 0)) > int(to_msg.get('internalDate', 0)):
             return from_msgs[0]['id']
@@ -278,23 +467,53 @@ def _extract_email(addr_header: str) -> str:
     """Pull the first bare email address out of a From/To header value."""
     if not addr_header:
         return ""
-    import re
-    m = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', addr_header)
+    m = _BARE_ADDR_RE.search(addr_header)
     return m.group(0).lower() if m else ""
 
 
+def _first_address(addr_header: str) -> str:
+    """Return the bare address of the first mailbox in a To/From header value.
+
+    Uses email.utils.getaddresses, so quoted display names containing commas
+    or angle brackets are handled. Falls back to the value unchanged if no
+    address can be parsed from it.
+    """
+    addresses = getaddresses([addr_header])
+    addr = addresses[0][1] if addresses else ''
+    return addr if '@' in addr else addr_header
+
+
 _SELF_EMAIL_CACHE = {}
 
 
+def _self_email_path():
+    """File next to the account's token that remembers its email address."""
+    return get_token_path().with_suffix('.email')
+
+
 def _get_self_email(service) -> str:
-    """Return the authenticated account's own email address (cached per account)."""
+    """Return the authenticated account's own email address (cached per account).
+
+    The address is also saved next to the token, so later invocations skip
+    the getProfile round trip. It is cleared whenever the account is
+    re-authorized.
+    """
     key = CURRENT_ACCOUNT
     if key not in _SELF_EMAIL_CACHE:
+        path = _self_email_path()
         try:
-            prof = service.users().getProfile(userId='me').execute()
-            _SELF_EMAIL_CACHE[key] = (prof.get('emailAddress') or '').lower()
-        except Exception:
-            _SELF_EMAIL_CACHE[key] = ''
+            _SELF_EMAIL_CACHE[key] = path.read_text().strip()
+        except OSError:
+            try:
+                prof = service.users().getProfile(userId='me').execute()
+                _SELF_EMAIL_CACHE[key] = (prof.get('emailAddress') or '').lower()
+            except Exception:
+                _SELF_EMAIL_CACHE[key] = ''
+            if _SELF_EMAIL_CACHE[key]:
+                try:
+                    path.write_text(_SELF_EMAIL_CACHE[key])
+                except OSError:
+                    pass
     return _SELF_EMAIL_CACHE[key]
 
 
@@ -309,14 +528,13 @@ def redirect_replyto_to_latest(service, reply_to_id: str) -> str:
     Kindle addresses.
     """
     try:
-        meta = service.users().messages().get(
-            userId='me', id=reply_to_id, format='metadata',
-            metadataHeaders=['From', 'To', 'Subject', 'Date']
-        ).execute()
+        # Same request as get_email_for_reply(), so when no redirect is needed
+        # the message is quoted from this fetch instead of a second one
+        meta = _get_message(service, reply_to_id, format='full', fields=MESSAGE_FULL_FIELDS)
     except Exception:
         return reply_to_id
 
-    headers = {h['name']: h['value'] for h in meta.get('payload', {}).get('headers', [])}
+    headers = _pick_headers(meta.get('payload', {}).get('headers', []), _REPLY_HEADER_NAMES)
     self_email = _get_self_email(service)
     from_email = _extract_email(headers.get('From', ''))
     to_email = _extract_email(headers.get('To', ''))
@@ -337,10 +555,9 @@ def redirect_replyto_to_latest(service, reply_to_id: str) -> str:
 
     try:
         old_d = int(meta.get('internalDate', 0))
-        new_meta = service.users().messages().get(
-            userId='me', id=latest_id, format='metadata',
-            metadataHeaders=['Subject', 'Date']
-        ).execute()
+        new_meta = _get_message(service, latest_id, format='metadata',
+                                metadataHeaders=['Subject', 'Date'],
+                                fields=MESSAGE_DATED_HEADERS_FIELDS)
         new_d = int(new_meta.get('internalDate', 0))
     except Exception:
         return reply_to_id
@@ -348,7 +565,7 @@ def redirect_replyto_to_latest(service, reply_to_id: str) -> str:
     if new_d <= old_d:
         return reply_to_id
 
-    nh = {h['name']: h['value'] for h in new_meta.get('payload', {}).get('headers', [])}
+    nh = _pick_headers(new_meta.get('payload', {}).get('headers', []), _REPLY_HEADER_NAMES)
     print(
         "Note: --reply-to pointed at an older message ("
         f"\"{headers.get('Subject', '')}\", {headers.get('Date', '')}). "
@@ -359,27 +576,75 @@ def redirect_replyto_to_latest(service, reply_to_id: str) -> str:
     return latest_id
 
 
+# What MIMEText(body) emits ahead of the caller's headers for a US-ASCII body
+_PLAIN_MIME_PREAMBLE = ('Content-Type: text/plain; charset="us-ascii"\n'
+                        'MIME-Version: 1.0\n'
+                        'Content-Transfer-Encoding: 7bit\n')
+# ...and for any other body, which MIMEText sends as base64-encoded UTF-8
+_UTF8_MIME_PREAMBLE = ('Content-Type: text/plain; charset="utf-8"\n'
+                       'MIME-Version: 1.0\n'
+                       'Content-Transfer-Encoding: base64\n')
+
+
+def _plain_message_bytes(body: str, headers: list) -> bytes:
+    """Serialize a plain-text message directly, byte-identical to MIMEText.as_bytes().
+
+    Handles the simple case: a body without carriage returns (ASCII sent as
+    7bit, anything else as base64 UTF-8) and ASCII headers short enough that
+    they need no folding or RFC 2047 encoding. Returns None otherwise, and
+    the caller falls back to MIMEText.
+    """
+    if '\r' in body:
+        return None
+    if body.isascii():
+        preamble = _PLAIN_MIME_PREAMBLE
+        payload = body
+    else:
+        try:
+            encoded = body.encode('utf-8')
+        except UnicodeEncodeError:  # lone surrogates
+            return None
+        preamble = _UTF8_MIME_PREAMBLE
+        payload = str(base64.encodebytes(encoded), 'ascii')
+    lines = [preamble]
+    for name, value in headers:
+        line = f"{name}: {value}"
+        # Any line boundary splitlines() knows (\x0b, \x0c and \x1c-\x1e as
+        # well as \r and \n) is split or rejected by the email generator
+        if not line.isascii() or len(line) > 78 or line.splitlines() != [line]:
+            return None
+        lines.append(line + '\n')
+    lines.append('\n')
+    lines.append(payload)
+    return ''.join(lines).encode('ascii')
+
+
 def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str = None,
                    reply_to_id: str = None, new_thread: bool = False, attachments: list = None,
-                   force_thread: bool = False):
+                   force_thread: bool = False, service=None):
     """Create an email message, automatically replying to existing thread unless --new is specified.
 
     Args:
         attachments: List of file paths to attach to the email.
+        service: Gmail API service to use (default: get_gmail_service()).
 
     Returns:
-        tuple: (raw_message, thread_id, to, subject, reply_to_id)
+        tuple: (message_bytes, thread_id, to, subject, reply_to_id), where
+        message_bytes is the serialized RFC 822 message (see _message_upload())
     """
-    service = get_gmail_service()
+    if service is None:
+        service = get_gmail_service()
 
     thread_id = None
     in_reply_to = None
     references = None
     use_html = False
     original = None
+    auto_threaded = False
 
-    # Check if body contains HTML tags
-    body_has_html = '<a ' in body or '<b>' in body or '<ul>' in body or '<li>' in body or '<br>' in body or '<p>' in body or '<h' in body or '<ol>' in body or '<hr' in body or '<blockquote' in body
+    # Check if body contains HTML tags: plain-text bodies usually have no '<'
+    # at all, which a single memchr-speed scan rules out before the regex runs
+    body_has_html = '<' in body and _HTML_BODY_RE.search(body) is not None
 
     # Auto-find prior thread if:
     # - Not explicitly starting a new thread (--new)
@@ -390,9 +655,7 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
     #   "Re: (No Subject)" which is ugly in the Gmail Sent folder.)
     if not new_thread and not reply_to_id and to:
         # Extract email address from "Name <email>" format if needed
-        email_addr = to
-        if '<' in to:
-            email_addr = to.split('<')[1].rstrip('>')
+        email_addr = _first_address(to)
 
         if email_addr.lower().endswith('@kindle.com'):
             print("Recipient is a Kindle Send-to-Kindle address; skipping auto-thread.")
@@ -400,12 +663,14 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
             auto_reply_id = find_latest_thread_message(service, email_addr)
             if auto_reply_id:
                 reply_to_id = auto_reply_id
+                auto_threaded = True
                 print(f"Auto-replying to existing thread (use --new to start fresh thread)")
 
     # An explicitly supplied reply-to may be stale (an old message in an old
     # thread). Unless the caller forces the original thread or wants a new one,
     # redirect to the most recent non-draft traffic with the same correspondent.
-    if reply_to_id and not new_thread and not force_thread:
+    # An auto-found target is already the latest, so it skips this lookup.
+    if reply_to_id and not new_thread and not force_thread and not auto_threaded:
         reply_to_id = redirect_replyto_to_latest(service, reply_to_id)
 
     # If replying to an existing message, fetch it and include quoted text
@@ -432,14 +697,27 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
             else:
                 source_addr = from_addr
             # Extract email from "Name <email>" format
-            if '<' in source_addr:
-                to = source_addr.split('<')[1].rstrip('>')
-            else:
-                to = source_addr
+            to = _first_address(source_addr)
 
         # Ensure subject has Re: prefix
         if not subject.lower().startswith('re:'):
-            subject = f"Re: {original['subject'].replace('Re: ', '').replace('RE: ', '')}"
+            subject = f"Re: {_RE_PREFIX_RE.sub('', original['subject'])}"
+
+    headers = [('to', to), ('subject', subject)]
+    if cc:
+        headers.append(('cc', cc))
+    if bcc:
+        headers.append(('bcc', bcc))
+    if in_reply_to:
+        headers.append(('In-Reply-To', in_reply_to))
+    if references:
+        headers.append(('References', references))
+
+    # Plain new-thread messages usually skip the MIME generator entirely
+    if not use_html and not body_has_html and not attachments:
+        raw_bytes = _plain_message_bytes(body, headers)
+        if raw_bytes is not None:
+            return raw_bytes, thread_id, to, subject, reply_to_id
 
     # Build the message body part
     if use_html and original:
@@ -450,10 +728,10 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
             body_escaped = html_module.escape(body)
             body_html = body_escaped.replace('\n', '<br>\n')
 
-        # Add quoted reply
-        quoted_html = format_quoted_reply_html(original)
-
-        full_html = f'''<div dir="ltr">{body_html}</div>{quoted_html}'''
+        # Body and quoted reply are joined in one pass (the quoted thread
+        # history is usually the bulk of the message)
+        full_html = ''.join(['<div dir="ltr">', body_html, '</div>',
+                             *_quoted_reply_html_parts(original)])
 
         # Create multipart message with both HTML and plain text
         body_part = MIMEMultipart('alternative')
@@ -461,7 +739,7 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
         # Plain text version (fallback) — strip HTML so Exchange/Outlook clients
         # that fall back to text/plain don't see raw <p>/<ol>/<li> tags.
         plain_text_body = _html_to_plain(body) if body_has_html else body
-        plain_body = plain_text_body + format_quoted_reply(original)
+        plain_body = ''.join([plain_text_body, *_quoted_reply_parts(original)])
         part_plain = MIMEText(plain_body, 'plain')
         body_part.attach(part_plain)
 
@@ -514,29 +792,52 @@ def create_message(to: str, subject: str, body: str, cc: str = None, bcc: str =
             if problem:
                 raise RuntimeError(f"Refusing to attach corrupt file. {problem}")
 
+            # Set the payload already base64-encoded: set_payload(bytes) would
+            # hold a surrogate-escaped str copy of the file (up to 4x its size)
+            # that encoders.encode_base64() then converts back to bytes
+            size = len(attachment_data)
             attachment = MIMEBase(maintype, subtype)
-            attachment.set_payload(attachment_data)
-            encoders.encode_base64(attachment)
+            attachment.set_payload(str(base64.encodebytes(attachment_data), 'ascii'))
+            del attachment_data
+            attachment['Content-Transfer-Encoding'] = 'base64'
             attachment.add_header('Content-Disposition', 'attachment', filename=filename)
             message.attach(attachment)
-            print(f"Attached: {filename} ({len(attachment_data)} bytes, integrity OK)")
+            print(f"Attached: {filename} ({size} bytes, integrity OK)")
     else:
         message = body_part
 
     # Set headers
-    message['to'] = to
-    message['subject'] = subject
-    if cc:
-        message['cc'] = cc
-    if bcc:
-        message['bcc'] = bcc
-    if in_reply_to:
-        message['In-Reply-To'] = in_reply_to
-    if references:
-        message['References'] = references
+    for name, value in headers:
+        message[name] = value
+
+    return message.as_bytes(), thread_id, to, subject, reply_to_id
+
+
+# Messages larger than this are uploaded as message/rfc822 media instead of
+# being base64url-encoded into the JSON request body
+MEDIA_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
 
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-    return raw, thread_id, to, subject, reply_to_id
+def _message_upload(message_bytes: bytes, thread_id: str = None):
+    """Build the message resource and media body for drafts.create/messages.send.
+
+    Small messages go inline as 'raw'. Large ones (attachments) are sent as a
+    resumable media upload, which skips the base64url copy of the whole
+    message and its JSON encoding, and uploads in chunks.
+
+    Returns: (message, media_body) where media_body is None for inline messages
+    """
+    message = {}
+    if thread_id:
+        message['threadId'] = thread_id
+    if len(message_bytes) <= MEDIA_UPLOAD_THRESHOLD:
+        message['raw'] = base64.urlsafe_b64encode(message_bytes).decode()
+        return message, None
+
+    from googleapiclient.http import MediaIoBaseUpload
+    media = MediaIoBaseUpload(io.BytesIO(message_bytes), mimetype='message/rfc822',
+                              resumable=True)
+    return message, media
 
 
 def create_draft(to: str, subject: str, body: str, cc: str = None, bcc: str = None,
@@ -544,15 +845,16 @@ def create_draft(to: str, subject: str, body: str, cc: str = None, bcc: str = No
                  force_thread: bool = False):
     """Create a draft email."""
     service = get_gmail_service()
-    raw, thread_id, to, subject, reply_to_id = create_message(
-        to, subject, body, cc, bcc, reply_to_id, new_thread, attachments, force_thread
+    message_bytes, thread_id, to, subject, reply_to_id = create_message(
+        to, subject, body, cc, bcc, reply_to_id, new_thread, attachments, force_thread,
+        service=service
     )
 
-    draft_body = {'message': {'raw': raw}}
-    if thread_id:
-        draft_body['message']['threadId'] = thread_id
-
-    draft = service.users().drafts().create(userId='me', body=draft_body).execute()
+    message, media = _message_upload(message_bytes, thread_id)
+    del message_bytes
+    draft = service.users().drafts().create(
+        userId='me', body={'message': message}, media_body=media
+    ).execute()
     print(f"Draft created successfully!")
     print(f"Draft ID: {draft['id']}")
     print(f"To: {to}")
@@ -567,15 +869,14 @@ def send_email(to: str, subject: str, body: str, cc: str = None, bcc: str = None
                force_thread: bool = False):
     """Send an email directly (not as draft)."""
     service = get_gmail_service()
-    raw, thread_id, to, subject, reply_to_id = create_message(
-        to, subject, body, cc, bcc, reply_to_id, new_thread, attachments, force_thread
+    message_bytes, thread_id, to, subject, reply_to_id = create_message(
+        to, subject, body, cc, bcc, reply_to_id, new_thread, attachments, force_thread,
+        service=service
     )
 
-    message_body = {'raw': raw}
-    if thread_id:
-        message_body['threadId'] = thread_id
-
-    sent = service.users().messages().send(userId='me', body=message_body).execute()
+    message, media = _message_upload(message_bytes, thread_id)
+    del message_bytes
+    sent = service.users().messages().send(userId='me', body=message, media_body=media).execute()
     print(f"Email sent successfully!")
     print(f"Message ID: {sent['id']}")
     print(f"To: {to}")
@@ -585,52 +886,226 @@ def send_email(to: str, subject: str, body: str, cc: str = None, bcc: str = None
     return sent
 
 
+# base64url -> standard base64 alphabet, applied to the str as received
+_URLSAFE_TO_STD = str.maketrans('-_', '+/')
+
+
+def _decode_body_data(data: str) -> str:
+    """Decode a part's base64url body data straight to text (invalid UTF-8 replaced).
+
+    Same result as urlsafe_b64decode(), which first copies the str to bytes
+    and then translates that copy; translating the str and decoding it
+    directly saves one full-size copy.
+    """
+    return str(binascii.a2b_base64(data.translate(_URLSAFE_TO_STD)), 'utf-8', 'replace')
+
+
+def _find_body_parts(payload):
+    """Find the first text/plain and first text/html part in a MIME tree.
+
+    Walks the tree depth-first in document order with an explicit stack and
+    stops once both are found. Parts with a filename are attachments (e.g. an
+    attached notes.txt) and are never taken as the body.
+
+    Returns: (plain_data, html_data) tuple of undecoded base64url strings or None
+    """
+    if HAS_FAST_MIME:
+        return _fast_find_body_parts(payload)
+
+    plain_data = None
+    html_data = None
+
+    stack = [payload]
+    while stack and (plain_data is None or html_data is None):
+        part = stack.pop()
+        mime_type = part.get('mimeType', '')
+        data = part.get('body', {}).get('data')
+        if data and not part.get('filename'):
+            if mime_type == 'text/plain' and plain_data is None:
+                plain_data = data
+            elif mime_type == 'text/html' and html_data is None:
+                html_data = data
+        # Descend into the top level and multipart containers only
+        if part is payload or mime_type.startswith('multipart/'):
+            stack.extend(reversed(part.get('parts', ())))
+    return plain_data, html_data
+
+
+def _load_large_body_parts(service, message_id: str, payload, want_html: bool = True):
+    """Fetch body text that Gmail returned by attachmentId instead of inline.
+
+    Gmail moves large text bodies out of the message resource. Only the first
+    text/plain part (and the first text/html part when want_html is set or
+    there is no plain part) is fetched; real attachments never are. The data
+    is stored back into the payload for _find_body_parts().
+    """
+    plain_part = None
+    html_part = None
+    stack = [payload]
+    while stack and (plain_part is None or html_part is None):
+        part = stack.pop()
+        mime_type = part.get('mimeType', '')
+        if not part.get('filename'):
+            if mime_type == 'text/plain' and plain_part is None:
+                plain_part = part
+            elif mime_type == 'text/html' and html_part is None:
+                html_part = part
+        if part is payload or mime_type.startswith('multipart/'):
+            stack.extend(reversed(part.get('parts', ())))
+
+    wanted = [plain_part]
+    if want_html or plain_part is None:
+        wanted.append(html_part)
+    for part in wanted:
+        body = part.get('body', {}) if part is not None else {}
+        if body.get('attachmentId') and not body.get('data'):
+            body['data'] = service.users().messages().attachments().get(
+                userId='me', messageId=message_id, id=body['attachmentId'], fields='data'
+            ).execute()['data']
+
+
+def _html_body_to_text(html_body: str) -> str:
+    """Derive a text body from an HTML-only email (the HTML itself without bs4)."""
+    if HAS_BS4:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_body, BS4_PARSER)
+        return soup.get_text(separator='\n', strip=True)
+    return html_body
+
+
 def extract_body_both(payload):
     """Extract both plain text and HTML body from email payload.
 
+    Only the first text/plain and first text/html part are base64-decoded.
+
     Returns: (text_body, html_body) tuple
     """
-    text_body = ""
-    html_body = ""
-
-    def _extract_recursive(payload):
-        nonlocal text_body, html_body
-
-        if 'body' in payload and payload['body'].get('data'):
-            mime_type = payload.get('mimeType', '')
-            data = base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8', errors='replace')
-            if mime_type == 'text/plain':
-                text_body = data
-            elif mime_type == 'text/html':
-                html_body = data
-
-        if 'parts' in payload:
-            for part in payload['parts']:
-                mime_type = part.get('mimeType', '')
-                if mime_type == 'text/plain' and part['body'].get('data'):
-                    text_body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8', errors='replace')
-                elif mime_type == 'text/html' and part['body'].get('data'):
-                    html_body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8', errors='replace')
-                elif mime_type.startswith('multipart/'):
-                    _extract_recursive(part)
-
-    _extract_recursive(payload)
+    plain_data, html_data = _find_body_parts(payload)
+
+    text_body = _decode_body_data(plain_data) if plain_data else ""
+    html_body = _decode_body_data(html_data) if html_data else ""
 
     # If no plain text, derive from HTML
     if not text_body and html_body:
-        if HAS_BS4:
-            soup = BeautifulSoup(html_body, 'html.parser')
-            text_body = soup.get_text(separator='\n', strip=True)
-        else:
-            text_body = html_body
+        text_body = _html_body_to_text(html_body)
 
     return text_body, html_body
 
 
 def extract_body(payload):
-    """Extract body text from email payload."""
-    text_body, html_body = extract_body_both(payload)
-    return text_body if text_body else html_body
+    """Extract body text from email payload.
+
+    The HTML part is only decoded (and parsed) when there is no text/plain part.
+    """
+    plain_data, html_data = _find_body_parts(payload)
+    if plain_data:
+        return _decode_body_data(plain_data)
+    if html_data:
+        html_body = _decode_body_data(html_data)
+        return _html_body_to_text(html_body) or html_body
+    return ""
+
+
+# Calls per batch HTTP request; Gmail allows 100 but rate-limits batches above 50
+BATCH_SIZE = 50
+
+# Worker threads for the per-call fallback when a batch request is rejected
+PARALLEL_WORKERS = 10
+
+# Batch failures worth retrying as single calls: the batch endpoint being
+# rate limited or overloaded. Anything else (400, 401, 403, ...) would fail
+# the same way on every individual call.
+BATCH_FALLBACK_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _execute_parallel(requests):
+    """Execute API requests concurrently and return the responses, in order.
+
+    httplib2.Http is not thread-safe, so each worker thread gets its own
+    authorized Http (and connection) for the current account.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from google_auth_httplib2 import AuthorizedHttp
+    from httplib2 import Http
+
+    creds = get_credentials()
+    local = threading.local()
+
+    def execute(request):
+        http = getattr(local, 'http', None)
+        if http is None:
+            http = local.http = AuthorizedHttp(creds, http=Http(timeout=HTTP_TIMEOUT))
+        return request.execute(http=http)
+
+    with ThreadPoolExecutor(max_workers=min(PARALLEL_WORKERS, len(requests))) as pool:
+        return list(pool.map(execute, requests))
+
+
+def _iter_batch_execute(service, requests):
+    """Execute API requests as batch HTTP requests of up to BATCH_SIZE calls.
+
+    Args:
+        requests: Unexecuted HttpRequest objects (e.g. from messages().get())
+
+    Yields:
+        Responses in the same order as requests, each batch's results as soon
+        as that batch completes. A failed call's exception is raised when its
+        position is reached. If the batch endpoint itself is rate limited or
+        overloaded, that chunk's calls are made individually on parallel
+        connections; any other batch failure is raised.
+    """
+    from googleapiclient.errors import HttpError
+
+    for offset in range(0, len(requests), BATCH_SIZE):
+        results = {}
+
+        def on_response(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+
+        chunk = requests[offset:offset + BATCH_SIZE]
+        batch = service.new_batch_http_request(callback=on_response)
+        for i, request in enumerate(chunk):
+            batch.add(request, request_id=str(i))
+        try:
+            batch.execute()
+        except HttpError as e:
+            if e.resp.status not in BATCH_FALLBACK_STATUSES:
+                raise
+            print(f"Batch request failed ({e.resp.status}), fetching individually", file=sys.stderr)
+            yield from _execute_parallel(chunk)
+            continue
+
+        for i in range(len(chunk)):
+            response, exception = results[i]
+            if exception is not None:
+                raise exception
+            yield response
+
+
+def _batch_execute(service, requests):
+    """Execute API requests in batches and return all responses, in order."""
+    return list(_iter_batch_execute(service, requests))
+
+
+def _iter_batch_get_messages(service, message_ids, **get_kwargs):
+    """Fetch many messages with messages.get, BATCH_SIZE calls per HTTP request.
+
+    Args:
+        message_ids: Message IDs to fetch
+        get_kwargs: Extra messages.get parameters (format, metadataHeaders, ...)
+
+    Yields:
+        Message resources in the same order as message_ids
+    """
+    messages = service.users().messages()
+    return _iter_batch_execute(service, [messages.get(userId='me', id=message_id, **get_kwargs)
+                                         for message_id in message_ids])
+
+
+def _batch_get_messages(service, message_ids, **get_kwargs):
+    """List form of _iter_batch_get_messages()."""
+    return list(_iter_batch_get_messages(service, message_ids, **get_kwargs))
 
 
 def search_emails(query: str, max_results: int = 10, full_content: bool = False,
@@ -649,16 +1124,17 @@ def search_emails(query: str, max_results: int = 10, full_content: bool = False,
 
     if with_person:
         # Run separate queries for from: and to: to avoid OR prioritization bug
-        # Request more results from each to ensure we get enough after deduping
+        # Request more results from each to ensure we get enough after deduping.
+        # Both queries go out in one batch request.
         fetch_per_query = max_results * 2
 
-        from_results = service.users().messages().list(
-            userId='me', q=f"from:{with_person}", maxResults=fetch_per_query
-        ).execute()
-
-        to_results = service.users().messages().list(
-            userId='me', q=f"to:{with_person}", maxResults=fetch_per_query
-        ).execute()
+        from_results, to_results = _batch_execute(service, [
+            service.users().messages().list(
+                userId='me', q=f"{direction}:{with_person}", maxResults=fetch_per_query,
+                fields=MESSAGE_LIST_FIELDS
+            )
+            for direction in ('from', 'to')
+        ])
 
         # Merge and dedupe by message ID
         seen_ids = set()
@@ -676,11 +1152,9 @@ def search_emails(query: str, max_results: int = 10, full_content: bool = False,
 
         # Fetch metadata to sort by date
         messages_with_dates = []
-        for msg in all_messages:
-            msg_meta = service.users().messages().get(
-                userId='me', id=msg['id'], format='metadata',
-                metadataHeaders=['Date']
-            ).execute()
+        all_meta = _batch_get_messages(service, [msg['id'] for msg in all_messages],
+                                      format='minimal', fields=MESSAGE_DATE_FIELDS)
+        for msg, msg_meta in zip(all_messages, all_meta):
             messages_with_dates.append({
                 'id': msg['id'],
                 'internalDate': int(msg_meta.get('internalDate', 0))
@@ -693,7 +1167,7 @@ def search_emails(query: str, max_results: int = 10, full_content: bool = False,
         messages = messages_with_dates[:max_results]
     else:
         results = service.users().messages().list(
-            userId='me', q=query, maxResults=max_results
+            userId='me', q=query, maxResults=max_results, fields=MESSAGE_LIST_FIELDS
         ).execute()
         messages = results.get('messages', [])
 
@@ -704,12 +1178,16 @@ def search_emails(query: str, max_results: int = 10, full_content: bool = False,
     print(f"Found {len(messages)} message(s):\n")
 
     emails = []
-    for msg in messages:
-        msg_data = service.users().messages().get(
-            userId='me', id=msg['id'], format='full'
-        ).execute()
-
-        headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
+    # Search results only print headers and the snippet unless --full is given
+    if full_content:
+        get_kwargs = {'format': 'full', 'fields': MESSAGE_FULL_FIELDS}
+    else:
+        get_kwargs = {'format': 'metadata', 'metadataHeaders': SEARCH_HEADERS,
+                      'fields': MESSAGE_HEADERS_FIELDS}
+    # Each batch of results is printed as soon as it arrives
+    all_data = _iter_batch_get_messages(service, [msg['id'] for msg in messages], **get_kwargs)
+    for msg, msg_data in zip(messages, all_data):
+        headers = _pick_headers(msg_data['payload']['headers'], _SEARCH_HEADER_NAMES)
 
         email_info = {
             'id': msg['id'],
@@ -724,6 +1202,7 @@ def search_emails(query: str, max_results: int = 10, full_content: bool = False,
         }
 
         if full_content:
+            _load_large_body_parts(service, msg['id'], msg_data['payload'], want_html=False)
             email_info['body'] = extract_body(msg_data['payload'])
 
         emails.append(email_info)
@@ -785,11 +1264,10 @@ def read_email(message_id: str):
     """Read a specific email by ID."""
     service = get_gmail_service()
 
-    msg_data = service.users().messages().get(
-        userId='me', id=message_id, format='full'
-    ).execute()
+    msg_data = _get_message(service, message_id, format='full', fields=MESSAGE_FULL_FIELDS)
 
-    headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
+    headers = _pick_headers(msg_data['payload']['headers'], _SEARCH_HEADER_NAMES)
+    _load_large_body_parts(service, message_id, msg_data['payload'], want_html=False)
     body = extract_body(msg_data['payload'])
 
     print(f"ID: {message_id}")
@@ -2,23 +2,54 @@
 """Google Calendar CRUD operations using OAuth credentials."""
 
 import argparse
+import functools
 import json
+import re
 import sys
-from datetime import datetime, timedelta
+from datetime import date as _date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
-except ImportError:
+
+
+def _ensure_google_packages():
+    """Install the Google API client libraries if they are missing.
+
+    Checks for the packages without importing them; the heavy imports are
+    deferred to get_credentials()/get_service() so that --help and argument
+    errors return without loading the API client.
+    """
+    from importlib.util import find_spec
+
+    try:
+        if all(find_spec(name) for name in ('google.oauth2', 'googleapiclient', 'google_auth_httplib2')):
+            return
+    except ModuleNotFoundError:
+        pass
     print("Installing required packages...")
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "-q",
                           "google-auth", "google-auth-oauthlib", "google-api-python-client"])
-    from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
+
+
+# Token file I/O uses orjson when available (faster, works in bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Optional incremental JSON parser for `list --stream`
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 # Paths to OAuth credentials (shared with the email skill)
 EMAIL_SKILL_DIR = Path.home() / ".claude/skills/email"
@@ -30,8 +61,16 @@ TOKEN_PATH = GCAL_SKILL_DIR / "token.json"
 CALENDAR_SCOPES = ['https://www.googleapis.com/auth/calendar']
 
 
-def get_credentials() -> Credentials:
-    """Load and refresh OAuth credentials, re-authenticating if needed."""
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> "Credentials":
+    """Load and refresh OAuth credentials, re-authenticating if needed.
+
+    Cached so token.json is read at most once per process; the credentials
+    object refreshes its own access token when it expires.
+    """
+    _ensure_google_packages()
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
 
     if not CLIENT_SECRETS_PATH.exists():
@@ -40,8 +79,8 @@ def get_credentials() -> Credentials:
     creds = None
 
     if TOKEN_PATH.exists():
-        with open(TOKEN_PATH) as f:
-            token_data = json.load(f)
+        with open(TOKEN_PATH, 'rb') as f:
+            token_data = _json_loads(f.read())
 
         creds = Credentials(
             token=token_data.get("token"),
@@ -70,16 +109,85 @@ def get_credentials() -> Credentials:
             "client_secret": creds.client_secret,
             "scopes": list(creds.scopes) if creds.scopes else CALENDAR_SCOPES
         }
-        with open(TOKEN_PATH, 'w') as f:
-            json.dump(token_data, f)
+        with open(TOKEN_PATH, 'wb') as f:
+            f.write(_json_dumps(token_data))
 
     return creds
 
 
+# Seconds before an API request times out
+HTTP_TIMEOUT = 30
+
+
+@functools.lru_cache(maxsize=1)
 def get_service():
-    """Get the Calendar API service."""
+    """Get the Calendar API service (built once per process).
+
+    All requests, including batches, go through one authorized Http object,
+    so its keep-alive connection to the API is reused rather than reopened.
+    """
     creds = get_credentials()
-    return build('calendar', 'v3', credentials=creds)
+    from googleapiclient.discovery import build
+    from google_auth_httplib2 import AuthorizedHttp
+    from httplib2 import Http
+
+    http = AuthorizedHttp(creds, http=Http(cache=None, timeout=HTTP_TIMEOUT))
+    return build('calendar', 'v3', http=http)
+
+
+# Partial-response masks: only the fields the commands below actually print
+EVENT_LIST_FIELDS = 'items(id,summary,location,start,end),nextPageToken'
+EVENT_DETAIL_FIELDS = 'id,summary,start,end,location,description,attendees(email,responseStatus)'
+
+# Timestamp format for API time bounds in UTC
+RFC3339_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Timezone applied to times given without an offset (PST)
+DEFAULT_TZ_OFFSET = '-08:00'
+DEFAULT_TIMEZONE = 'America/Los_Angeles'
+
+ONE_DAY = timedelta(days=1)
+
+
+@functools.lru_cache(maxsize=16)
+def _delta_days(days):
+    """timedelta for a --days window, shared across calls."""
+    return timedelta(days=days)
+
+
+# Trailing UTC designator or offset on an ISO-8601 datetime ('Z', '+05:30', '-0800')
+_TZ_SUFFIX_RE = re.compile(r'(Z|[+\-]\d{2}:?\d{2})$')
+
+
+def _has_tz(value):
+    """Return True if an ISO-8601 datetime string already carries a timezone."""
+    return _TZ_SUFFIX_RE.search(value) is not None
+
+
+# Display names in the C locale, as strftime's %a / %b produce them
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+# 12-hour clock hour and AM/PM for each hour of the day, as %I / %p produce them
+_CLOCK_HOURS = tuple((f"{(h - 1) % 12 + 1:02d}", 'AM' if h < 12 else 'PM') for h in range(24))
+
+
+def _format_time(iso):
+    """Format an ISO-8601 datetime string as 'HH:MM AM', in its own UTC offset."""
+    hour, meridiem = _CLOCK_HOURS[int(iso[11:13])]
+    return f"{hour}:{iso[14:16]} {meridiem}"
+
+
+def _format_datetime(iso):
+    """
+    Format an ISO-8601 datetime string as 'Tue Jan 13, 10:00 AM'.
+
+    Equivalent to fromisoformat() + strftime('%a %b %d, %I:%M %p') but reads
+    the fields straight from the string, so no timezone objects are built.
+    """
+    year, month, day = int(iso[0:4]), int(iso[5:7]), int(iso[8:10])
+    weekday = _WEEKDAYS[_date(year, month, day).weekday()]
+    return f"{weekday} {_MONTHS[month - 1]} {iso[8:10]}, {_format_time(iso)}"
 
 
 def list_calendars():
@@ -87,22 +195,65 @@ def list_calendars():
     service = get_service()
     calendars = service.calendarList().list().execute()
 
-    print("Your calendars:")
+    # Build the listing and write it in one call
+    out = ["Your calendars:\n"]
     for cal in calendars.get('items', []):
         primary = " (primary)" if cal.get('primary') else ""
-        print(f"  - {cal['summary']}{primary}")
-        print(f"    ID: {cal['id']}")
+        out.append(f"  - {cal['summary']}{primary}\n")
+        out.append(f"    ID: {cal['id']}\n")
+    sys.stdout.write(''.join(out))
 
     return calendars.get('items', [])
 
 
-def list_events(calendar_id='primary', days=7, max_results=20, query=None):
-    """List upcoming events."""
+def _format_event_listing(event):
+    """Format one event as it appears in the list command output."""
+    start = event['start'].get('dateTime', event['start'].get('date'))
+
+    # Format datetime nicely
+    if 'T' in start:
+        start_str = _format_datetime(start)
+    else:
+        start_str = start
+
+    summary = event.get('summary', '(No title)')
+    location = event.get('location', '')
+    event_id = event.get('id', '')
+
+    text = f"\n  {start_str}: {summary}\n"
+    if location:
+        text += f"    Location: {location}\n"
+    return text + f"    ID: {event_id[:20]}...\n"
+
+
+def _iter_events_streamed(request):
+    """
+    Yield the items of an events.list response while it is still downloading.
+
+    Sends the prepared API request over a streaming HTTP session and parses
+    the body incrementally with ijson, so only one event dict is held at a time.
+    """
+    from google.auth.transport.requests import AuthorizedSession
+
+    session = AuthorizedSession(get_credentials())
+    with session.get(request.uri, stream=True, timeout=HTTP_TIMEOUT) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'items.item')
+
+
+def list_events(calendar_id='primary', days=7, max_results=20, query=None, stream=False):
+    """
+    List upcoming events.
+
+    With stream=True (and ijson installed) events are printed as the
+    response is parsed instead of after it has been fully loaded.
+    """
     service = get_service()
 
-    now = datetime.utcnow()
-    time_min = now.isoformat() + 'Z'
-    time_max = (now + timedelta(days=days)).isoformat() + 'Z'
+    now = datetime.now(timezone.utc)
+    time_min = now.strftime(RFC3339_UTC_FORMAT)
+    time_max = (now + _delta_days(days)).strftime(RFC3339_UTC_FORMAT)
 
     params = {
         'calendarId': calendar_id,
@@ -110,47 +261,45 @@ def list_events(calendar_id='primary', days=7, max_results=20, query=None):
         'timeMax': time_max,
         'maxResults': max_results,
         'singleEvents': True,
-        'orderBy': 'startTime'
+        'orderBy': 'startTime',
+        'fields': EVENT_LIST_FIELDS,
     }
 
     if query:
         params['q'] = query
 
-    events_result = service.events().list(**params).execute()
+    request = service.events().list(**params)
+
+    if stream and HAS_IJSON:
+        events = []
+        for event in _iter_events_streamed(request):
+            if not events:
+                sys.stdout.write(f"Events in the next {days} days:\n")
+            events.append(event)
+            sys.stdout.write(_format_event_listing(event))
+        if not events:
+            print(f"No events found in the next {days} days.")
+        return events
+
+    events_result = request.execute()
     events = events_result.get('items', [])
 
     if not events:
         print(f"No events found in the next {days} days.")
         return []
 
-    print(f"Events in the next {days} days:")
-    for event in events:
-        start = event['start'].get('dateTime', event['start'].get('date'))
-        end = event['end'].get('dateTime', event['end'].get('date'))
-
-        # Format datetime nicely
-        if 'T' in start:
-            start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-            start_str = start_dt.strftime('%a %b %d, %I:%M %p')
-        else:
-            start_str = start
-
-        summary = event.get('summary', '(No title)')
-        location = event.get('location', '')
-        event_id = event.get('id', '')
-
-        print(f"\n  {start_str}: {summary}")
-        if location:
-            print(f"    Location: {location}")
-        print(f"    ID: {event_id[:20]}...")
-
+    # Build the listing and write it in one call
+    out = [f"Events in the next {days} days:\n"]
+    out.extend(_format_event_listing(event) for event in events)
+    sys.stdout.write(''.join(out))
     return events
 
 
 def get_event(event_id, calendar_id='primary'):
     """Get a specific event by ID."""
     service = get_service()
-    event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    event = service.events().get(calendarId=calendar_id, eventId=event_id,
+                                 fields=EVENT_DETAIL_FIELDS).execute()
 
     print(f"Event: {event.get('summary', '(No title)')}")
     print(f"  Start: {event['start'].get('dateTime', event['start'].get('date'))}")
@@ -168,45 +317,42 @@ def get_event(event_id, calendar_id='primary'):
     return event
 
 
-def create_event(summary, start, end=None, duration_mins=60, location=None,
-                 description=None, attendees=None, calendar_id='primary'):
+def _normalize_dt(value):
     """
-    Create a new calendar event.
+    Normalize a user-supplied start/end time.
 
-    Args:
-        summary: Event title
-        start: Start time (ISO format or 'YYYY-MM-DD HH:MM')
-        end: End time (optional, uses duration if not provided)
-        duration_mins: Duration in minutes (default 60)
-        location: Event location
-        description: Event description
-        attendees: Comma-separated list of email addresses
-        calendar_id: Calendar ID (default 'primary')
+    Accepts 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM' or ISO-8601, and defaults
+    datetimes without a timezone to PST.
+
+    Returns:
+        (is_datetime, normalized) tuple; date-only values are returned as-is
     """
-    service = get_service()
+    if ' ' in value and 'T' not in value:
+        value = value.replace(' ', 'T')
+    if 'T' not in value:
+        return False, value
+    if not _has_tz(value):
+        value += DEFAULT_TZ_OFFSET
+    return True, value
 
-    # Parse start time
-    if ' ' in start and 'T' not in start:
-        start = start.replace(' ', 'T')
 
-    if 'T' in start:
-        # DateTime event
-        if not start.endswith('Z') and '+' not in start and '-' not in start[-6:]:
-            start += '-08:00'  # Default to PST
+def _build_event_body(summary, start, end=None, duration_mins=60, location=None,
+                      description=None, attendees=None):
+    """Build an events.insert body from create_event-style arguments."""
+    is_datetime, start = _normalize_dt(start)
 
+    if is_datetime:
+        # DateTime event
         if end:
-            if ' ' in end and 'T' not in end:
-                end = end.replace(' ', 'T')
-            if not end.endswith('Z') and '+' not in end and '-' not in end[-6:]:
-                end += '-08:00'
+            _, end = _normalize_dt(end)
         else:
             # Calculate end from duration
             start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
             end_dt = start_dt + timedelta(minutes=duration_mins)
             end = end_dt.isoformat()
 
-        start_body = {'dateTime': start, 'timeZone': 'America/Los_Angeles'}
-        end_body = {'dateTime': end, 'timeZone': 'America/Los_Angeles'}
+        start_body = {'dateTime': start, 'timeZone': DEFAULT_TIMEZONE}
+        end_body = {'dateTime': end, 'timeZone': DEFAULT_TIMEZONE}
     else:
         # All-day event
         start_body = {'date': start}
@@ -229,6 +375,29 @@ def create_event(summary, start, end=None, duration_mins=60, location=None,
     if attendees:
         event['attendees'] = [{'email': e.strip()} for e in attendees.split(',')]
 
+    return event
+
+
+def create_event(summary, start, end=None, duration_mins=60, location=None,
+                 description=None, attendees=None, calendar_id='primary'):
+    """
+    Create a new calendar event.
+
+    Args:
+        summary: Event title
+        start: Start time (ISO format or 'YYYY-MM-DD HH:MM')
+        end: End time (optional, uses duration if not provided)
+        duration_mins: Duration in minutes (default 60)
+        location: Event location
+        description: Event description
+        attendees: Comma-separated list of email addresses
+        calendar_id: Calendar ID (default 'primary')
+    """
+    service = get_service()
+
+    event = _build_event_body(summary, start, end, duration_mins, location,
+                              description, attendees)
+
     created = service.events().insert(calendarId=calendar_id, body=event).execute()
 
     print(f"Event created: {created.get('summary')}")
@@ -238,6 +407,65 @@ def create_event(summary, start, end=None, duration_mins=60, location=None,
     return created
 
 
+# Calls per batch HTTP request: Google's recommended size (the Calendar API
+# accepts up to 1000)
+BATCH_SIZE = 50
+
+
+def create_events_bulk(events_list, calendar_id='primary'):
+    """
+    Create many events using batched API requests.
+
+    Args:
+        events_list: List of dicts with the create_event arguments
+                     (summary, start, end, duration, location, description, attendees)
+        calendar_id: Calendar ID (default 'primary')
+
+    Returns:
+        List of created events (failed inserts are reported and skipped)
+    """
+    service = get_service()
+    bodies = [
+        _build_event_body(
+            summary=e['summary'],
+            start=e['start'],
+            end=e.get('end'),
+            duration_mins=e.get('duration', 60),
+            location=e.get('location'),
+            description=e.get('description'),
+            attendees=e.get('attendees'),
+        )
+        for e in events_list
+    ]
+
+    results = {}
+
+    def on_response(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    # Up to BATCH_SIZE inserts share one multipart HTTP request
+    for offset in range(0, len(bodies), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_response)
+        for i, body in enumerate(bodies[offset:offset + BATCH_SIZE], offset):
+            batch.add(service.events().insert(calendarId=calendar_id, body=body),
+                      request_id=str(i))
+        batch.execute()
+
+    created = []
+    for i, body in enumerate(bodies):
+        response, exception = results.get(i, (None, None))
+        if exception is not None or response is None:
+            print(f"Failed to create: {body.get('summary')} ({exception})")
+            continue
+        created.append(response)
+        print(f"Event created: {response.get('summary')}")
+        print(f"  Link: {response.get('htmlLink')}")
+        print(f"  ID: {response.get('id')}")
+
+    print(f"Created {len(created)} of {len(bodies)} events")
+    return created
+
+
 def update_event(event_id, calendar_id='primary', summary=None, start=None,
                  end=None, location=None, description=None):
     """Update an existing event."""
@@ -252,24 +480,13 @@ def update_event(event_id, calendar_id='primary', summary=None, start=None,
         event['location'] = location
     if description:
         event['description'] = description
-    if start:
-        if ' ' in start and 'T' not in start:
-            start = start.replace(' ', 'T')
-        if 'T' in start:
-            if not start.endswith('Z') and '+' not in start and '-' not in start[-6:]:
-                start += '-08:00'
-            event['start'] = {'dateTime': start, 'timeZone': 'America/Los_Angeles'}
-        else:
-            event['start'] = {'date': start}
-    if end:
-        if ' ' in end and 'T' not in end:
-            end = end.replace(' ', 'T')
-        if 'T' in end:
-            if not end.endswith('Z') and '+' not in end and '-' not in end[-6:]:
-                end += '-08:00'
-            event['end'] = {'dateTime': end, 'timeZone': 'America/Los_Angeles'}
-        else:
-            event['end'] = {'date': end}
+    for key, value in (('start', start), ('end', end)):
+        if value:
+            is_datetime, value = _normalize_dt(value)
+            if is_datetime:
+                event[key] = {'dateTime': value, 'timeZone': DEFAULT_TIMEZONE}
+            else:
+                event[key] = {'date': value}
 
     updated = service.events().update(calendarId=calendar_id, eventId=event_id, body=event).execute()
 
@@ -293,10 +510,10 @@ def check_availability(date, calendar_id='primary'):
     # Parse date
     if len(date) == 10:  # YYYY-MM-DD
         day_start = datetime.fromisoformat(date)
-        day_end = day_start + timedelta(days=1)
+        day_end = day_start + ONE_DAY
     else:
         day_start = datetime.fromisoformat(date.replace(' ', 'T'))
-        day_end = day_start + timedelta(days=1)
+        day_end = day_start + ONE_DAY
 
     time_min = day_start.isoformat() + 'Z' if day_start.tzinfo is None else day_start.isoformat()
     time_max = day_end.isoformat() + 'Z' if day_end.tzinfo is None else day_end.isoformat()
@@ -306,23 +523,25 @@ def check_availability(date, calendar_id='primary'):
         timeMin=time_min,
         timeMax=time_max,
         singleEvents=True,
-        orderBy='startTime'
+        orderBy='startTime',
+        fields=EVENT_LIST_FIELDS
     ).execute()
 
     events = events_result.get('items', [])
 
-    print(f"Events on {date}:")
+    # Build the listing and write it in one call
+    out = [f"Events on {date}:\n"]
     if not events:
-        print("  No events - day is free!")
+        out.append("  No events - day is free!\n")
     else:
         for event in events:
             start = event['start'].get('dateTime', event['start'].get('date'))
             if 'T' in start:
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                start_str = start_dt.strftime('%I:%M %p')
+                start_str = _format_time(start)
             else:
                 start_str = "All day"
-            print(f"  {start_str}: {event.get('summary', '(No title)')}")
+            out.append(f"  {start_str}: {event.get('summary', '(No title)')}\n")
+    sys.stdout.write(''.join(out))
 
     return events
 
@@ -340,6 +559,8 @@ def main():
     list_parser.add_argument('--max', '-m', type=int, default=20, help='Max events')
     list_parser.add_argument('--query', '-q', help='Search query')
     list_parser.add_argument('--calendar', '-c', default='primary', help='Calendar ID')
+    list_parser.add_argument('--stream', action='store_true',
+                             help='Print events while the response downloads (requires ijson)')
 
     # Get event
     get_parser = subparsers.add_parser('get', help='Get event details')
@@ -348,14 +569,15 @@ def main():
 
     # Create event
     create_parser = subparsers.add_parser('create', help='Create new event')
-    create_parser.add_argument('--summary', '-s', required=True, help='Event title')
-    create_parser.add_argument('--start', required=True, help='Start time (YYYY-MM-DD HH:MM or YYYY-MM-DD)')
+    create_parser.add_argument('--summary', '-s', help='Event title')
+    create_parser.add_argument('--start', help='Start time (YYYY-MM-DD HH:MM or YYYY-MM-DD)')
     create_parser.add_argument('--end', help='End time')
     create_parser.add_argument('--duration', '-d', type=int, default=60, help='Duration in minutes')
     create_parser.add_argument('--location', '-l', help='Location')
     create_parser.add_argument('--description', help='Description')
     create_parser.add_argument('--attendees', '-a', help='Comma-separated emails')
     create_parser.add_argument('--calendar', '-c', default='primary', help='Calendar ID')
+    create_parser.add_argument('--from-json', help='JSON file with an array of events to create in batches')
 
     # Update event
     update_parser = subparsers.add_parser('update', help='Update event')
@@ -379,13 +601,19 @@ def main():
 
     args = parser.parse_args()
 
+    if args.command == 'create' and not args.from_json and not (args.summary and args.start):
+        create_parser.error("--summary and --start are required unless --from-json is given")
+
     try:
         if args.command == 'calendars':
             list_calendars()
         elif args.command == 'list':
-            list_events(args.calendar, args.days, args.max, args.query)
+            list_events(args.calendar, args.days, args.max, args.query, args.stream)
         elif args.command == 'get':
             get_event(args.event_id, args.calendar)
+        elif args.command == 'create' and args.from_json:
+            with open(args.from_json) as f:
+                create_events_bulk(json.load(f), args.calendar)
         elif args.command == 'create':
             create_event(
                 summary=args.summary,
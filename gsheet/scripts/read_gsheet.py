@@ -2,23 +2,49 @@
 """Read Google Sheets data using existing OAuth credentials."""
 
 import argparse
+import functools
 import json
+import os
+import random
 import re
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
-except ImportError:
+
+
+def _ensure_google_packages():
+    """Install the Google API client libraries if they are missing.
+
+    Checks for the packages without importing them; the heavy imports are
+    deferred to get_credentials()/get_service() so that --help and argument
+    errors return without loading the API client.
+    """
+    from importlib.util import find_spec
+
+    try:
+        if all(find_spec(name) for name in ('google.oauth2', 'googleapiclient', 'google_auth_httplib2')):
+            return
+    except ModuleNotFoundError:
+        pass
     print("Installing required packages...")
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "-q",
                           "google-auth", "google-auth-oauthlib", "google-api-python-client"])
-    from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-    from google.auth.transport.requests import Request
+
+
+# Token file I/O uses orjson when available (faster, works in bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
 # Paths to OAuth credentials (shared with the email skill)
 EMAIL_SKILL_DIR = Path.home() / ".claude/skills/email"
@@ -29,30 +55,42 @@ CLIENT_SECRETS_PATH = EMAIL_SKILL_DIR / "credentials.json"
 SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
 
+# Google Sheets URL pattern: .../spreadsheets/d/<id>/...
+_ID_RE = re.compile(r'/d/([a-zA-Z0-9-_]+)')
+
+
 def extract_spreadsheet_id(url_or_id: str) -> str:
     """Extract spreadsheet ID from URL or return as-is if already an ID."""
-    # Match Google Sheets URL pattern
-    match = re.search(r'/d/([a-zA-Z0-9-_]+)', url_or_id)
+    match = _ID_RE.search(url_or_id)
     if match:
         return match.group(1)
     # Assume it's already an ID
     return url_or_id
 
 
-def get_credentials() -> Credentials:
-    """Load and refresh OAuth credentials, re-authenticating if sheets scope is missing."""
+@functools.lru_cache(maxsize=1)
+def get_credentials() -> "Credentials":
+    """Load and refresh OAuth credentials, re-authenticating if sheets scope is missing.
+
+    Cached so the token file is read at most once per process; the credentials
+    object refreshes its own access token when it expires.
+    """
+    _ensure_google_packages()
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
 
     if not CLIENT_SECRETS_PATH.exists():
         raise FileNotFoundError(f"Client secrets not found at {CLIENT_SECRETS_PATH}. Copy from Gmail skill.")
 
     creds = None
+    saved_token_data = None
     gsheet_token_path = EMAIL_SKILL_DIR / "gsheet_token.json"
 
     # Try to load existing gsheet-specific token
     if gsheet_token_path.exists():
-        with open(gsheet_token_path) as f:
-            token_data = json.load(f)
+        with open(gsheet_token_path, 'rb') as f:
+            token_data = saved_token_data = _json_loads(f.read())
 
         creds = Credentials(
             token=token_data.get("token"),
@@ -82,47 +120,144 @@ def get_credentials() -> Credentials:
             "client_secret": creds.client_secret,
             "scopes": list(creds.scopes) if creds.scopes else SHEETS_SCOPES
         }
-        with open(gsheet_token_path, 'w') as f:
-            json.dump(token_data, f)
+        if token_data != saved_token_data:
+            _save_token(gsheet_token_path, token_data)
 
     return creds
 
 
-def list_sheets(spreadsheet_id: str) -> list:
-    """List all sheet names in a spreadsheet."""
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+def _save_token(path: Path, token_data: dict):
+    """Write the token file atomically, readable by the owner only.
 
-    spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheets = spreadsheet.get('sheets', [])
+    Written to a temp file and renamed over the old one, so a crash mid-write
+    never leaves a truncated token behind (which would force a re-auth).
+    """
+    tmp_path = path.with_suffix('.json.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(_json_dumps(token_data))
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, path)
 
-    return [sheet['properties']['title'] for sheet in sheets]
 
+# Seconds before an API request times out
+HTTP_TIMEOUT = 30
 
-def get_sheet_info(spreadsheet_id: str) -> list:
-    """Get sheet names and IDs."""
+
+@functools.lru_cache(maxsize=1)
+def get_service():
+    """Get the Sheets API service (built once per process).
+
+    Every helper below shares it, so the discovery document is parsed and
+    the token file read only once however many calls a command makes. All
+    requests go through one authorized Http object, so its keep-alive
+    connection to the API is reused rather than reopened.
+    """
     creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    from googleapiclient.discovery import build
+    from google_auth_httplib2 import AuthorizedHttp
+    from httplib2 import Http
+
+    http = AuthorizedHttp(creds, http=Http(cache=None, timeout=HTTP_TIMEOUT))
+    return build('sheets', 'v4', http=http)
+
+
+# Rate limiting (429) is always retried; transient server errors only for
+# requests that are safe to repeat
+RATE_LIMIT_STATUS = 429
+SERVER_ERROR_STATUSES = {500, 502, 503, 504}
+MAX_TRIES = 5
+MAX_BACKOFF = 60
+
+
+def _execute(request, idempotent: bool = True):
+    """Execute an API request, retrying rate limits and transient server errors.
+
+    Waits as long as the server's Retry-After header asks when it sends one,
+    otherwise backs off exponentially with jitter (~1s, 2s, 4s, ...). Pass
+    idempotent=False for writes that would repeat if retried (appends, row
+    inserts): a 5xx may come back after the write was applied, so those are
+    only retried on 429.
+    """
+    from googleapiclient.errors import HttpError
+
+    for attempt in range(MAX_TRIES):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status
+            retryable = status == RATE_LIMIT_STATUS or (idempotent and status in SERVER_ERROR_STATUSES)
+            if not retryable or attempt == MAX_TRIES - 1:
+                raise
+            retry_after = e.resp.get('retry-after', '')
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = 2 ** attempt + random.random()
+            time.sleep(min(delay, MAX_BACKOFF))
+
 
-    spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheets = spreadsheet.get('sheets', [])
+# Seconds a spreadsheet's sheet list is reused before it is fetched again
+SHEET_META_TTL = 60
 
-    return [(sheet['properties']['title'], sheet['properties']['sheetId']) for sheet in sheets]
+# Partial-response mask: just the sheet properties read below, not grid
+# data, merges, conditional formats, etc.
+SHEET_PROPERTIES_FIELDS = 'sheets.properties(title,sheetId)'
+
+_SHEET_META_CACHE = {}
+
+
+def _get_sheet_properties(spreadsheet_id: str) -> list:
+    """Return the 'properties' dict of every sheet, in tab order.
+
+    Cached per spreadsheet for SHEET_META_TTL seconds, so commands that look
+    up the sheet list more than once (first-sheet defaults, name -> ID
+    lookups, reordering) fetch the spreadsheet metadata only once.
+    """
+    cached = _SHEET_META_CACHE.get(spreadsheet_id)
+    if cached is not None and time.monotonic() - cached[0] < SHEET_META_TTL:
+        return cached[1]
+
+    service = get_service()
+    spreadsheet = _execute(service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields=SHEET_PROPERTIES_FIELDS
+    ))
+    properties = [sheet['properties'] for sheet in spreadsheet.get('sheets', [])]
+    _SHEET_META_CACHE[spreadsheet_id] = (time.monotonic(), properties)
+    return properties
+
+
+def list_sheets(spreadsheet_id: str) -> list:
+    """List all sheet names in a spreadsheet."""
+    return [props['title'] for props in _get_sheet_properties(spreadsheet_id)]
+
+
+def get_sheet_info(spreadsheet_id: str) -> list:
+    """Get sheet names and IDs."""
+    return [(props['title'], props['sheetId']) for props in _get_sheet_properties(spreadsheet_id)]
 
 
 def reorder_sheets(spreadsheet_id: str, sheet_order: list) -> None:
     """Reorder sheets to match the given order."""
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
     # Get current sheet info
     sheet_info = get_sheet_info(spreadsheet_id)
     sheet_name_to_id = {name: sid for name, sid in sheet_info}
 
+    # Track the tab order as each move is applied, so only sheets that are
+    # not already in place get a request
+    current_order = [name for name, _ in sheet_info]
+
     # Build batch update requests
     requests = []
     for index, sheet_name in enumerate(sheet_order):
         if sheet_name in sheet_name_to_id:
+            if current_order.index(sheet_name) == index:
+                continue
+            current_order.remove(sheet_name)
+            current_order.insert(index, sheet_name)
             requests.append({
                 'updateSheetProperties': {
                     'properties': {
@@ -136,26 +271,43 @@ def reorder_sheets(spreadsheet_id: str, sheet_order: list) -> None:
             print(f"Warning: Sheet '{sheet_name}' not found, skipping")
 
     if requests:
-        service.spreadsheets().batchUpdate(
+        _execute(service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': requests}
-        ).execute()
+        ))
+        # The cached sheet list is in the old tab order
+        _SHEET_META_CACHE.pop(spreadsheet_id, None)
         print(f"Reordered {len(requests)} sheet(s)")
 
 
 def move_sheet_to_front(spreadsheet_id: str, sheet_name: str) -> None:
     """Move a specific sheet to the first position."""
-    sheet_info = get_sheet_info(spreadsheet_id)
-    current_order = [name for name, _ in sheet_info]
-
-    if sheet_name not in current_order:
+    if sheet_name not in list_sheets(spreadsheet_id):
         raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet")
 
-    # Remove and insert at front
-    current_order.remove(sheet_name)
-    new_order = [sheet_name] + current_order
+    # The other sheets shift along by themselves, so only this one moves
+    reorder_sheets(spreadsheet_id, [sheet_name])
 
-    reorder_sheets(spreadsheet_id, new_order)
+
+def _range_string(sheet_name: str = None, range_spec: str = None) -> str:
+    """A1-notation range for a sheet and/or range; None if neither is given."""
+    if sheet_name and range_spec:
+        return f"'{sheet_name}'!{range_spec}"
+    elif sheet_name:
+        return f"'{sheet_name}'"
+    return range_spec
+
+
+def _as_table(values: list) -> dict:
+    """Split a values list into the 'headers', 'rows', 'raw' dict read_sheet returns."""
+    if not values:
+        return {'headers': [], 'rows': [], 'raw': []}
+
+    return {
+        'headers': values[0],
+        'rows': values[1:],
+        'raw': values
+    }
 
 
 def read_sheet(spreadsheet_id: str, sheet_name: str = None, range_spec: str = None) -> dict:
@@ -170,46 +322,42 @@ def read_sheet(spreadsheet_id: str, sheet_name: str = None, range_spec: str = No
     Returns:
         dict with 'headers', 'rows', and 'raw' data
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
-    # Build range string
-    if sheet_name and range_spec:
-        range_str = f"'{sheet_name}'!{range_spec}"
-    elif sheet_name:
-        range_str = f"'{sheet_name}'"
-    elif range_spec:
-        range_str = range_spec
-    else:
-        range_str = None
-
-    if range_str:
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_str
-        ).execute()
-    else:
+    range_str = _range_string(sheet_name, range_spec)
+    if not range_str:
         # Get first sheet
-        spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-        first_sheet = spreadsheet['sheets'][0]['properties']['title']
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=f"'{first_sheet}'"
-        ).execute()
+        first_sheet = _get_sheet_properties(spreadsheet_id)[0]['title']
+        range_str = f"'{first_sheet}'"
 
-    values = result.get('values', [])
+    result = _execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=range_str
+    ))
 
-    if not values:
-        return {'headers': [], 'rows': [], 'raw': []}
+    return _as_table(result.get('values', []))
 
-    headers = values[0] if values else []
-    rows = values[1:] if len(values) > 1 else []
 
-    return {
-        'headers': headers,
-        'rows': rows,
-        'raw': values
-    }
+def read_sheets(spreadsheet_id: str, range_specs: list, sheet_name: str = None) -> list:
+    """
+    Read several ranges with a single values.batchGet request.
+
+    Args:
+        spreadsheet_id: The spreadsheet ID
+        range_specs: Ranges like "A1:D10", or "'Sheet'!A1:D10" when sheet_name is not given
+        sheet_name: Optional sheet name applied to every range
+
+    Returns:
+        List of dicts like read_sheet's, one per range, in order
+    """
+    service = get_service()
+
+    result = _execute(service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=[_range_string(sheet_name, spec) for spec in range_specs]
+    ))
+
+    return [_as_table(value_range.get('values', [])) for value_range in result.get('valueRanges', [])]
 
 
 def update_cell(spreadsheet_id: str, sheet_name: str, cell: str, value: str) -> dict:
@@ -225,17 +373,16 @@ def update_cell(spreadsheet_id: str, sheet_name: str, cell: str, value: str) ->
     Returns:
         dict with update result
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
     range_str = f"'{sheet_name}'!{cell}"
 
-    result = service.spreadsheets().values().update(
+    result = _execute(service.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
         range=range_str,
         valueInputOption='USER_ENTERED',
         body={'values': [[value]]}
-    ).execute()
+    ))
 
     return result
 
@@ -253,30 +400,25 @@ def update_range(spreadsheet_id: str, sheet_name: str, range_spec: str, values:
     Returns:
         dict with update result
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
     range_str = f"'{sheet_name}'!{range_spec}"
 
-    result = service.spreadsheets().values().update(
+    result = _execute(service.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
         range=range_str,
         valueInputOption='USER_ENTERED',
         body={'values': values}
-    ).execute()
+    ))
 
     return result
 
 
 def get_sheet_id(spreadsheet_id: str, sheet_name: str) -> int:
     """Get the sheet ID for a given sheet name."""
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-
-    spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    for sheet in spreadsheet.get('sheets', []):
-        if sheet['properties']['title'] == sheet_name:
-            return sheet['properties']['sheetId']
+    for props in _get_sheet_properties(spreadsheet_id):
+        if props['title'] == sheet_name:
+            return props['sheetId']
 
     raise ValueError(f"Sheet '{sheet_name}' not found")
 
@@ -294,8 +436,7 @@ def insert_row(spreadsheet_id: str, sheet_name: str, after_row: int, values: lis
     Returns:
         dict with result
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
     sheet_id = get_sheet_id(spreadsheet_id, sheet_name)
 
@@ -312,25 +453,44 @@ def insert_row(spreadsheet_id: str, sheet_name: str, after_row: int, values: lis
         }
     }
 
-    service.spreadsheets().batchUpdate(
+    # Values are pasted into the new row in the same batchUpdate, parsed as if
+    # typed (like valueInputOption=USER_ENTERED). Tab-delimited, so values
+    # containing tabs or newlines still go through a separate values.update.
+    values = [str(v) for v in values] if values else None
+    paste = values and not any('\t' in v or '\n' in v or '\r' in v for v in values)
+    requests = [request]
+    if paste:
+        requests.append({
+            'pasteData': {
+                'coordinate': {'sheetId': sheet_id, 'rowIndex': after_row, 'columnIndex': 0},
+                'data': '\t'.join(values),
+                'delimiter': '\t',
+                'type': 'PASTE_NORMAL'
+            }
+        })
+
+    _execute(service.spreadsheets().batchUpdate(
         spreadsheetId=spreadsheet_id,
-        body={'requests': [request]}
-    ).execute()
+        body={'requests': requests}
+    ), idempotent=False)
 
-    # If values provided, populate the new row
-    if values:
+    if values and not paste:
         new_row_num = after_row + 1
         range_str = f"'{sheet_name}'!A{new_row_num}"
-        service.spreadsheets().values().update(
+        _execute(service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=range_str,
             valueInputOption='USER_ENTERED',
             body={'values': [values]}
-        ).execute()
+        ))
 
     return {'inserted_after_row': after_row, 'new_row': after_row + 1}
 
 
+# Joins a column's cells for find_row_by_value (newlines can occur in cells)
+_CELL_SEPARATOR = '\0'
+
+
 def find_row_by_value(spreadsheet_id: str, sheet_name: str, search_column: str, search_value: str) -> int:
     """
     Find the row number containing a specific value in a column.
@@ -344,17 +504,29 @@ def find_row_by_value(spreadsheet_id: str, sheet_name: str, search_column: str,
     Returns:
         Row number (1-indexed) or -1 if not found
     """
-    data = read_sheet(spreadsheet_id, sheet_name)
+    service = get_service()
+
+    # Fetch only the searched column, as one list of cells
+    column = search_column.upper()
+    result = _execute(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=f"'{sheet_name}'!{column}:{column}",
+        majorDimension='COLUMNS'
+    ))
+    cells = result.get('values', [[]])[0]
 
-    # Determine column index
-    col_index = ord(search_column.upper()) - ord('A')
+    needle = search_value.lower()
+    if not cells or _CELL_SEPARATOR in needle:
+        return -1
 
-    for i, row in enumerate(data['raw']):
-        if col_index < len(row):
-            if search_value.lower() in str(row[col_index]).lower():
-                return i + 1  # 1-indexed row number
+    # One C-level find over the whole column; cells can't contain NUL,
+    # so counting separators before the hit gives its row
+    buf = _CELL_SEPARATOR.join(map(str, cells)).lower()
+    pos = buf.find(needle)
+    if pos < 0:
+        return -1
 
-    return -1
+    return buf.count(_CELL_SEPARATOR, 0, pos) + 1  # 1-indexed row number
 
 
 def format_as_markdown_table(data: dict) -> str:
@@ -362,35 +534,20 @@ def format_as_markdown_table(data: dict) -> str:
     if not data['headers']:
         return "No data found."
 
-    headers = data['headers']
-    rows = data['rows']
-
-    # Calculate column widths
-    widths = [len(str(h)) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < len(widths):
-                widths[i] = max(widths[i], len(str(cell)))
-            else:
-                widths.append(len(str(cell)))
+    headers = [str(h) for h in data['headers']]
+    n = len(headers)
 
-    # Build table
-    lines = []
+    # Stringify cells, padding short rows and dropping cells past the headers
+    rows = [[str(cell) for cell in row[:n]] + [""] * (n - len(row)) for row in data['rows']]
 
-    # Header row
-    header_cells = [str(h).ljust(widths[i]) for i, h in enumerate(headers)]
-    lines.append("| " + " | ".join(header_cells) + " |")
+    # Calculate column widths, one max() per column
+    widths = [max(map(len, col)) for col in zip(headers, *rows)]
 
-    # Separator
-    lines.append("| " + " | ".join(["-" * w for w in widths[:len(headers)]]) + " |")
+    def render(cells):
+        return "| " + " | ".join(map(str.ljust, cells, widths)) + " |"
 
-    # Data rows
-    for row in rows:
-        cells = []
-        for i in range(len(headers)):
-            cell = str(row[i]) if i < len(row) else ""
-            cells.append(cell.ljust(widths[i]))
-        lines.append("| " + " | ".join(cells) + " |")
+    lines = [render(headers), "| " + " | ".join(["-" * w for w in widths]) + " |"]
+    lines.extend(map(render, rows))
 
     return "\n".join(lines)
 
@@ -407,26 +564,168 @@ def append_row(spreadsheet_id: str, sheet_name: str, values: list) -> dict:
     Returns:
         dict with result
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    return append_rows(spreadsheet_id, sheet_name, [values])
+
+
+def append_rows(spreadsheet_id: str, sheet_name: str, rows: list) -> dict:
+    """
+    Append several rows at the end of the sheet in one request.
+
+    Args:
+        spreadsheet_id: The spreadsheet ID
+        sheet_name: Sheet name
+        rows: 2D list of values, one list per row
+
+    Returns:
+        dict with result
+    """
+    service = get_service()
 
     range_str = f"'{sheet_name}'!A:A"
 
-    result = service.spreadsheets().values().append(
+    result = _execute(service.spreadsheets().values().append(
         spreadsheetId=spreadsheet_id,
         range=range_str,
         valueInputOption='USER_ENTERED',
         insertDataOption='INSERT_ROWS',
-        body={'values': [values]}
-    ).execute()
+        body={'values': rows}
+    ), idempotent=False)
 
     return result
 
 
+# Rows per values.append request when appending a CSV (SHEETS_BATCH_ROWS
+# overrides), and a cap on each request's JSON body, kept 1 MB under the
+# API's 10 MB request limit to leave room for the URL and headers
+DEFAULT_BATCH_ROWS = 2000
+MAX_BATCH_BYTES = 9_000_000
+
+
+def _batch_rows() -> int:
+    """Rows per append request: SHEETS_BATCH_ROWS if it is a positive integer."""
+    try:
+        rows = int(os.getenv('SHEETS_BATCH_ROWS', DEFAULT_BATCH_ROWS))
+    except ValueError:
+        return DEFAULT_BATCH_ROWS
+    return rows if rows > 0 else DEFAULT_BATCH_ROWS
+
+
+def _row_batches(rows):
+    """Yield lists of rows of at most _batch_rows() rows and MAX_BATCH_BYTES of JSON."""
+    batch_rows = _batch_rows()
+    batch = []
+    size = 0
+    for row in rows:
+        # Encoded as googleapiclient sends it (ASCII, non-ASCII \u-escaped),
+        # plus the separating comma
+        row_size = len(json.dumps(row).encode()) + 1
+        if batch and (len(batch) >= batch_rows or size + row_size > MAX_BATCH_BYTES):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(row)
+        size += row_size
+    if batch:
+        yield batch
+
+
+def append_csv(spreadsheet_id: str, sheet_name: str, csv_path: str) -> int:
+    """
+    Append every row of a local CSV file, SHEETS_BATCH_ROWS rows per request.
+
+    Returns:
+        Number of rows appended
+    """
+    import csv
+
+    appended = 0
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for batch in _row_batches(csv.reader(f)):
+            append_rows(spreadsheet_id, sheet_name, batch)
+            appended += len(batch)
+    return appended
+
+
+_CELL_RE = re.compile(r'([A-Za-z]+)([0-9]+)')
+
+
+def column_index(letters: str) -> int:
+    """Convert a column letter like "A" or "AB" to a 0-based index."""
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + ord(ch) - ord('A') + 1
+    return index - 1
+
+
+def column_letter(index: int) -> str:
+    """Convert a 0-based column index to its letter, e.g. 27 -> "AB"."""
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+def _consecutive_runs(keys):
+    """Split sorted (major, minor) pairs into runs with the same major and consecutive minors."""
+    run = []
+    for key in keys:
+        if run and (run[-1][0] != key[0] or run[-1][1] + 1 != key[1]):
+            yield run
+            run = []
+        run.append(key)
+    if run:
+        yield run
+
+
+def _coalesce_cell_updates(sheet_name: str, updates: list) -> list:
+    """Group single-cell updates into as few ValueRanges as possible.
+
+    Runs of adjacent cells in a row become one horizontal range, and
+    remaining runs in a column one vertical range. Anything that is not a
+    plain cell reference (e.g. "A1:B2") is passed through unchanged. A cell
+    updated twice keeps its last value, as it would in a per-cell batch.
+    """
+    cells = {}
+    data = []
+    for update in updates:
+        match = _CELL_RE.fullmatch(update['cell'])
+        if match:
+            cells[(int(match.group(2)), column_index(match.group(1)))] = update['value']
+        else:
+            data.append({
+                'range': f"'{sheet_name}'!{update['cell']}",
+                'values': [[update['value']]]
+            })
+
+    singles = []
+    for run in _consecutive_runs(sorted(cells)):
+        if len(run) == 1:
+            singles.extend(run)
+            continue
+        (row, first), (_, last) = run[0], run[-1]
+        data.append({
+            'range': f"'{sheet_name}'!{column_letter(first)}{row}:{column_letter(last)}{row}",
+            'values': [[cells[rc] for rc in run]]
+        })
+
+    for run in _consecutive_runs(sorted((col, row) for row, col in singles)):
+        (col, first), (_, last) = run[0], run[-1]
+        end = f":{column_letter(col)}{last}" if len(run) > 1 else ''
+        data.append({
+            'range': f"'{sheet_name}'!{column_letter(col)}{first}{end}",
+            'values': [[cells[(row, col)]] for _, row in run]
+        })
+    return data
+
+
 def batch_update_cells(spreadsheet_id: str, sheet_name: str, updates: list) -> dict:
     """
     Update multiple cells in a single batch.
 
+    Adjacent cells are sent as one range (see _coalesce_cell_updates()).
+
     Args:
         spreadsheet_id: The spreadsheet ID
         sheet_name: Sheet name
@@ -435,23 +734,17 @@ def batch_update_cells(spreadsheet_id: str, sheet_name: str, updates: list) -> d
     Returns:
         dict with result
     """
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service()
 
-    data = []
-    for update in updates:
-        data.append({
-            'range': f"'{sheet_name}'!{update['cell']}",
-            'values': [[update['value']]]
-        })
+    data = _coalesce_cell_updates(sheet_name, updates)
 
-    result = service.spreadsheets().values().batchUpdate(
+    result = _execute(service.spreadsheets().values().batchUpdate(
         spreadsheetId=spreadsheet_id,
         body={
             'valueInputOption': 'USER_ENTERED',
             'data': data
         }
-    ).execute()
+    ))
 
     return result
 
@@ -460,7 +753,8 @@ def main():
     parser = argparse.ArgumentParser(description="Read and write Google Sheets")
     parser.add_argument("spreadsheet", help="Spreadsheet URL or ID")
     parser.add_argument("--sheet", "-s", help="Sheet name (default: first sheet)")
-    parser.add_argument("--range", "-r", help="Range to read (e.g., 'A1:D10' or '1:5')")
+    parser.add_argument("--range", "-r", action="append",
+                       help="Range to read (e.g., 'A1:D10' or '1:5'); repeat to fetch several in one request")
     parser.add_argument("--list-sheets", "-l", action="store_true", help="List all sheet names")
     parser.add_argument("--move-to-front", "-m", help="Move specified sheet to first position")
     parser.add_argument("--format", "-f", choices=["json", "markdown", "csv"], default="markdown",
@@ -473,6 +767,7 @@ def main():
     parser.add_argument("--insert-row", type=int, help="Insert new row after this row number")
     parser.add_argument("--row-values", help="Comma-separated values for new row (use with --insert-row or --append)")
     parser.add_argument("--append", action="store_true", help="Append a new row at end of sheet")
+    parser.add_argument("--append-csv", metavar="PATH", help="Append all rows of a local CSV file at end of sheet")
     parser.add_argument("--batch-edit", help="JSON array of cell updates, e.g., '[{\"cell\":\"A1\",\"value\":\"x\"}]'")
 
     args = parser.parse_args()
@@ -496,6 +791,13 @@ def main():
             print(f"Appended row to '{sheet}'")
             return
 
+        # Handle CSV append
+        if args.append_csv:
+            sheet = args.sheet or list_sheets(spreadsheet_id)[0]
+            count = append_csv(spreadsheet_id, sheet, args.append_csv)
+            print(f"Appended {count} row(s) to '{sheet}'")
+            return
+
         # Handle insert row
         if args.insert_row:
             sheet = args.sheet or list_sheets(spreadsheet_id)[0]
@@ -533,24 +835,31 @@ def main():
                 print(f"  {i}. {name}")
             return
 
-        data = read_sheet(spreadsheet_id, args.sheet, args.range)
+        # Without an explicit range, ask only for the header plus N rows
+        if args.rows and not args.range:
+            args.range = [f"1:{args.rows + 1}"]
+
+        if args.range and len(args.range) > 1:
+            tables = read_sheets(spreadsheet_id, args.range, args.sheet)
+        else:
+            tables = [read_sheet(spreadsheet_id, args.sheet, args.range[0] if args.range else None)]
 
         # Apply row limit
-        if args.rows and data['rows']:
-            data['rows'] = data['rows'][:args.rows]
-            data['raw'] = [data['headers']] + data['rows']
+        for data in tables:
+            if args.rows and data['rows']:
+                data['rows'] = data['rows'][:args.rows]
+                data['raw'] = [data['headers']] + data['rows']
 
         if args.format == "json":
-            print(json.dumps(data, indent=2))
+            print(json.dumps(tables[0] if len(tables) == 1 else tables, indent=2))
         elif args.format == "csv":
             import csv
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerows(data['raw'])
-            print(output.getvalue())
+            writer = csv.writer(sys.stdout)
+            for data in tables:
+                writer.writerows(data['raw'])
+                print()
         else:  # markdown
-            print(format_as_markdown_table(data))
+            print("\n\n".join(format_as_markdown_table(data) for data in tables))
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)